@@ -3,17 +3,27 @@
 Safely removes event logs for completed jobs when final output exists.
 Never deletes logs for active or incomplete jobs.
 """
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-import json
 import logging
+import os
+import re
 import sys
 
-from pdf_transcriber.events import read_event_log_typed
+from pdf_transcriber.events import iter_event_log_reversed, iter_event_log_typed, parse_event
 from pdf_transcriber.event_types import JobStartedEvent, JobCompletedEvent
 
 logger = logging.getLogger(__name__)
 
+# Drops brackets and quotes, turns spaces and underscores into hyphens
+_JOB_ID_TABLE = str.maketrans({
+    **dict.fromkeys("()[]{}\"'"),
+    " ": "-",
+    "_": "-",
+})
+_HYPHEN_RUNS = re.compile(r"-{2,}")
+
 
 @dataclass
 class CleanupResult:
@@ -74,25 +84,22 @@ def _normalize_job_id(name: str) -> str:
     Job IDs are created by slugifying directory names in the events module.
     This tries to reverse that process for matching.
     """
-    # Simple normalization: lowercase, replace spaces/special chars with hyphens
-    normalized = name.lower()
-    # Remove parentheses and other special characters
-    for char in "()[]{}\"'":
-        normalized = normalized.replace(char, "")
-    # Replace spaces and underscores with hyphens
-    normalized = normalized.replace(" ", "-")
-    normalized = normalized.replace("_", "-")
-    # Remove consecutive hyphens
-    while "--" in normalized:
-        normalized = normalized.replace("--", "-")
-    normalized = normalized.strip("-")
-    return normalized
+    # Lowercase, drop brackets/quotes, spaces and underscores to hyphens,
+    # then collapse hyphen runs
+    normalized = name.lower().translate(_JOB_ID_TABLE)
+    return _HYPHEN_RUNS.sub("-", normalized).strip("-")
 
 
 def check_job_completed(log_path: Path) -> tuple[bool, str | None]:
     """
     Check if a job has a job_completed event and extract output path.
 
+    job_completed is normally the last line and job_started the first, so
+    the log is searched backwards for the former and forwards for the
+    latter; both searches stop at the first match. The backward search
+    only JSON-decodes lines that mention job_completed, so a log without
+    one (an active or failed job) costs a substring scan, not a parse.
+
     Args:
         log_path: Path to events.jsonl file
 
@@ -100,16 +107,15 @@ def check_job_completed(log_path: Path) -> tuple[bool, str | None]:
         Tuple of (has_completion_event, output_dir_from_job_started)
     """
     try:
-        events = read_event_log_typed(log_path)
-
         # Find job_completed event
         has_completion = any(
-            isinstance(event, JobCompletedEvent) for event in events
+            _is_job_completed(raw)
+            for raw in iter_event_log_reversed(log_path, contains=b"job_completed")
         )
 
         # Extract output_dir from job_started event
         output_dir = None
-        for event in events:
+        for event in iter_event_log_typed(log_path):
             if isinstance(event, JobStartedEvent):
                 output_dir = event.output_dir
                 break
@@ -121,6 +127,15 @@ def check_job_completed(log_path: Path) -> tuple[bool, str | None]:
         return False, None
 
 
+def _is_job_completed(raw: dict) -> bool:
+    """Whether a raw event is a well-formed job_completed event."""
+    try:
+        return isinstance(parse_event(raw), JobCompletedEvent)
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Skipping unparseable event: {e}")
+        return False
+
+
 def find_symlink_for_central_log(central_log: Path, output_dir: str | None) -> Path | None:
     """
     Find the symlink that points to a central log file.
@@ -155,6 +170,104 @@ def find_symlink_for_central_log(central_log: Path, output_dir: str | None) -> P
     return None
 
 
+@dataclass
+class _LogOutcome:
+    """Decision for one event log, reported back to cleanup_telemetry()."""
+    log_path: Path
+    deleted: bool
+    error: str | None = None
+    messages: list[str] = field(default_factory=list)
+
+
+def _process_one_log(log_path: Path, dry_run: bool, verbose: bool) -> _LogOutcome:
+    """
+    Decide whether to delete one central event log, deleting it unless dry_run.
+
+    Verbose output is collected in the outcome rather than printed, so logs
+    processed concurrently don't interleave their reports.
+    """
+    outcome = _LogOutcome(log_path=log_path, deleted=False)
+    messages = outcome.messages if verbose else []
+
+    try:
+        # Check if job is completed
+        has_completion, output_dir = check_job_completed(log_path)
+
+        if not has_completion:
+            messages += [
+                f"KEEP: {log_path.name}",
+                f"  Reason: No job_completed event (active or failed job)",
+                "",
+            ]
+            return outcome
+
+        # Job is marked complete - check if output exists
+        if output_dir is None:
+            messages += [
+                f"KEEP: {log_path.name}",
+                f"  Reason: Cannot determine output directory",
+                "",
+            ]
+            return outcome
+
+        # Look for final output file
+        output_path = Path(output_dir).expanduser()
+        final_output = None
+
+        # Find .md file in output directory (not .original.md)
+        if output_path.exists() and output_path.is_dir():
+            for md_file in output_path.glob("*.md"):
+                if not md_file.name.endswith(".original.md"):
+                    final_output = md_file
+                    break
+
+        if final_output is None or not final_output.exists():
+            messages += [
+                f"KEEP: {log_path.name}",
+                f"  Reason: Final output not found in {output_path}",
+                "",
+            ]
+            return outcome
+
+        # All conditions met - safe to delete
+        messages += [
+            f"DELETE: {log_path.name}",
+            f"  Reason: Job completed and output exists at {final_output}",
+        ]
+
+        # Find and delete symlink
+        symlink = find_symlink_for_central_log(log_path, output_dir)
+
+        if not dry_run:
+            # Delete central log
+            log_path.unlink()
+            messages.append(f"  Deleted: {log_path}")
+
+            # Delete symlink if found (use is_symlink() to catch broken symlinks)
+            if symlink and (symlink.is_symlink() or symlink.exists()):
+                symlink.unlink()
+                messages.append(f"  Deleted symlink: {symlink}")
+        else:
+            messages.append(f"  Would delete: {log_path}")
+            if symlink:
+                messages.append(f"  Would delete symlink: {symlink}")
+
+        messages.append("")
+        outcome.deleted = True
+
+    except Exception as e:
+        error_msg = f"Error processing {log_path.name}: {e}"
+        logger.error(error_msg)
+        outcome.error = error_msg
+        messages += [
+            f"ERROR: {log_path.name}",
+            f"  {e}",
+            "",
+        ]
+
+    return outcome
+
+
 def cleanup_telemetry(
     central_dir: Path | None = None,
     dry_run: bool = False,
@@ -204,94 +317,27 @@ def cleanup_telemetry(
         print(f"Found {len(event_logs)} event log(s) in {central_dir}")
         print()
 
-    for log_path in event_logs:
-        job_id = log_path.stem
+    # Each log is decided independently and the work is file I/O, so
+    # fan out across threads; map() keeps results in glob order
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(
+            lambda log_path: _process_one_log(log_path, dry_run, verbose),
+            event_logs
+        ))
 
-        try:
-            # Check if job is completed
-            has_completion, output_dir = check_job_completed(log_path)
-
-            if not has_completion:
-                if verbose:
-                    print(f"KEEP: {log_path.name}")
-                    print(f"  Reason: No job_completed event (active or failed job)")
-                    print()
-                result.logs_kept += 1
-                result.kept_files.append(str(log_path))
-                continue
-
-            # Job is marked complete - check if output exists
-            if output_dir is None:
-                if verbose:
-                    print(f"KEEP: {log_path.name}")
-                    print(f"  Reason: Cannot determine output directory")
-                    print()
-                result.logs_kept += 1
-                result.kept_files.append(str(log_path))
-                continue
-
-            # Look for final output file
-            output_path = Path(output_dir).expanduser()
-            final_output = None
-
-            # Find .md file in output directory (not .original.md)
-            if output_path.exists() and output_path.is_dir():
-                for md_file in output_path.glob("*.md"):
-                    if not md_file.name.endswith(".original.md"):
-                        final_output = md_file
-                        break
-
-            if final_output is None or not final_output.exists():
-                if verbose:
-                    print(f"KEEP: {log_path.name}")
-                    print(f"  Reason: Final output not found in {output_path}")
-                    print()
-                result.logs_kept += 1
-                result.kept_files.append(str(log_path))
-                continue
-
-            # All conditions met - safe to delete
-            if verbose:
-                print(f"DELETE: {log_path.name}")
-                print(f"  Reason: Job completed and output exists at {final_output}")
-
-            # Find and delete symlink
-            symlink = find_symlink_for_central_log(log_path, output_dir)
-
-            if not dry_run:
-                # Delete central log
-                log_path.unlink()
-                if verbose:
-                    print(f"  Deleted: {log_path}")
-
-                # Delete symlink if found (use is_symlink() to catch broken symlinks)
-                if symlink and (symlink.is_symlink() or symlink.exists()):
-                    symlink.unlink()
-                    if verbose:
-                        print(f"  Deleted symlink: {symlink}")
-            else:
-                if verbose:
-                    print(f"  Would delete: {log_path}")
-                    if symlink:
-                        print(f"  Would delete symlink: {symlink}")
-
-            if verbose:
-                print()
+    for outcome in outcomes:
+        for line in outcome.messages:
+            print(line)
 
+        if outcome.deleted:
             result.logs_deleted += 1
-            result.deleted_files.append(str(log_path))
-
-        except Exception as e:
-            error_msg = f"Error processing {log_path.name}: {e}"
-            logger.error(error_msg)
-            result.errors.append(error_msg)
+            result.deleted_files.append(str(outcome.log_path))
+        else:
             result.logs_kept += 1
-            result.kept_files.append(str(log_path))
-
-            if verbose:
-                print(f"ERROR: {log_path.name}")
-                print(f"  {e}")
-                print()
+            result.kept_files.append(str(outcome.log_path))
+        if outcome.error is not None:
+            result.errors.append(outcome.error)
 
     return result
 
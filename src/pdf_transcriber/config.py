@@ -32,6 +32,7 @@ class Config:
     use_gpu: bool = True  # Auto-detected in load()
     marker_batch_size: int = 1  # Pages per batch (not currently used)
     marker_langs: list = field(default_factory=lambda: ["English"])
+    engine_idle_ttl: int = 0  # Seconds before an unused cached engine is freed (0 = keep until cleared)
 
     # LLM-enhanced OCR settings (Marker's built-in LLM mode)
     # NOTE: Requires a VISION model (VLM) - text-only models won't work
@@ -93,6 +94,10 @@ class Config:
         if val := os.environ.get("PDF_TRANSCRIBER_AUTO_CHUNK_THRESHOLD"):
             config.auto_chunk_threshold = int(val)
 
+        # Override engine cache idle timeout from env
+        if val := os.environ.get("PDF_TRANSCRIBER_ENGINE_IDLE_TTL"):
+            config.engine_idle_ttl = int(val)
+
         # Override LLM settings from env
         if val := os.environ.get("PDF_TRANSCRIBER_USE_LLM"):
             config.use_llm = val.lower() in ("true", "1", "yes")
@@ -1,14 +1,21 @@
 """Core modules for PDF transcription."""
-from .transcription import TranscriptionEngine
+import importlib
+
 from .engine_cache import (
     TranscriptionResult,
     get_transcription_engine,
     clear_engine_cache,
 )
-from .pdf_processor import PDFProcessor
 from .state_manager import StateManager, TranscriptionState
 from .metadata_parser import PaperMetadata
 
+# Heavy modules (Marker models, PyMuPDF) load on first attribute access so
+# importing any lightweight core submodule doesn't pay for them.
+_LAZY_ATTRS = {
+    "TranscriptionEngine": ".transcription",
+    "PDFProcessor": ".pdf_processor",
+}
+
 __all__ = [
     "TranscriptionEngine",
     "TranscriptionResult",
@@ -19,3 +26,10 @@ __all__ = [
     "TranscriptionState",
     "PaperMetadata",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
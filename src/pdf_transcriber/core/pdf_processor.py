@@ -22,7 +22,7 @@ class PDFProcessor:
     Uses PyMuPDF (fitz) for rendering with configurable DPI.
     """
 
-    def __init__(self, pdf_path: str | Path, dpi: int = 150):
+    def __init__(self, pdf_path: str | Path, dpi: int = 150, validate: bool = True):
         """
         Initialize PDF processor.
 
@@ -32,11 +32,17 @@ class PDFProcessor:
                  - 100 DPI: ~1275×1650px (fast)
                  - 150 DPI: ~1913×2475px (balanced - recommended)
                  - 200 DPI: ~2550×3300px (high quality)
+            validate: Resolve the path and check it exists (default: True).
+                 Pass False when the caller already resolved and stat'ed it.
         """
-        self.pdf_path = Path(pdf_path).expanduser().resolve()
         self.dpi = dpi
         self.doc = None
 
+        if not validate:
+            self.pdf_path = Path(pdf_path)
+            return
+
+        self.pdf_path = Path(pdf_path).expanduser().resolve()
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {self.pdf_path}")
 
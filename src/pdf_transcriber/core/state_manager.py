@@ -8,12 +8,7 @@ import json
 import logging
 import shutil
 
-from pdf_transcriber.events import (
-    read_event_log,
-    read_event_log_typed,
-    get_last_completed_page,
-    validate_completed_pages,
-)
+from pdf_transcriber.events import parse_event, read_event_log_from
 from pdf_transcriber.event_types import JobStartedEvent, ErrorEvent
 
 logger = logging.getLogger(__name__)
@@ -56,6 +51,31 @@ class TranscriptionState:
         return cls(**data)
 
 
+def _apply_events(state: TranscriptionState, raw_events: list[dict]) -> None:
+    """Fold raw events logged after a checkpoint into a replayed state."""
+    completed = [
+        event["page_number"]
+        for event in raw_events
+        if event.get("event_type") == "page_completed"
+    ]
+    if completed:
+        state.completed_pages = sorted(state.completed_pages + completed)
+
+    for raw in raw_events:
+        if raw.get("event_type") != "error":
+            continue
+        try:
+            event = parse_event(raw)
+        except (ValueError, KeyError):
+            continue
+        if isinstance(event, ErrorEvent) and event.severity == "error":
+            if event.page_number and event.page_number not in state.failed_pages:
+                state.failed_pages.append(event.page_number)
+
+    if raw_events:
+        state.last_updated = raw_events[-1].get("timestamp", state.started_at)
+
+
 class StateManager:
     """
     Manages transcription progress and resume capability.
@@ -65,13 +85,24 @@ class StateManager:
     - page_NNN.md: Individual completed pages (for assembly)
     """
 
-    def __init__(self, output_dir: Path, paper_name: str):
+    def __init__(
+        self,
+        output_dir: Path,
+        paper_name: str,
+        flush_every: int = 1,
+        snapshot_every: int = 0
+    ):
         """
         Initialize state manager.
 
         Args:
             output_dir: Base output directory
             paper_name: Name of the paper (used for subdirectory)
+            flush_every: Completed pages to batch before rewriting state.json
+                (default: 1, write on every page). Chunk boundaries,
+                failures and flush_batch() always write immediately.
+            snapshot_every: Chunk checkpoints between replay snapshots
+                (default: 0, never snapshot automatically)
         """
         self.output_dir = Path(output_dir)
         self.paper_name = paper_name
@@ -79,6 +110,17 @@ class StateManager:
         self.state_file = self.progress_dir / "state.json"
         self.events_log = self.output_dir / paper_name / "events.jsonl"
 
+        # Replay checkpoint: (event log byte offset, state replayed up to it)
+        self.snapshot_file = self.progress_dir / "snapshot.json"
+        self.snapshot_every = snapshot_every
+        self._checkpoint: tuple[int, TranscriptionState] | None = None
+        self._chunks_since_snapshot = 0
+
+        # Batched state.json writes: latest unsaved state + pages since last write
+        self.flush_every = max(1, flush_every)
+        self._pending_state: TranscriptionState | None = None
+        self._pending_pages = 0
+
     def has_existing_job(self) -> bool:
         """Check if a resumable job exists."""
         # Check both new event log and old state.json for backward compatibility
@@ -88,8 +130,10 @@ class StateManager:
         """
         Load state by replaying event log.
 
-        This is the new event-driven resume approach. Falls back to
-        load_state() for backward compatibility.
+        This is the new event-driven resume approach. Only events appended
+        since the last checkpoint are replayed: the checkpoint is kept in
+        memory between calls and persisted by snapshot() for later resumes.
+        Falls back to load_state() for backward compatibility.
 
         Returns:
             TranscriptionState reconstructed from events, None if no events
@@ -100,59 +144,95 @@ class StateManager:
             return self.load_state()
 
         try:
-            # Read raw events for validate_completed_pages (operates on raw dicts)
-            raw_events = read_event_log(self.events_log)
-            if not raw_events:
-                return self.load_state()
-
-            # Read typed events for structured access
-            typed_events = read_event_log_typed(self.events_log)
-            if not typed_events:
-                return self.load_state()
-
-            # Find job_started event
-            job_started = None
-            for event in typed_events:
-                if isinstance(event, JobStartedEvent):
-                    job_started = event
-                    break
-
-            if not job_started:
-                logger.warning("No job_started event found, falling back to state.json")
-                return self.load_state()
-
-            # Collect completed and failed pages
-            all_completed, validated = validate_completed_pages(raw_events, validation_count=10)
-
-            failed_pages: list[int] = []
-            for event in typed_events:
-                if isinstance(event, ErrorEvent) and event.severity == "error":
-                    if event.page_number and event.page_number not in failed_pages:
-                        failed_pages.append(event.page_number)
-
-            # Reconstruct state — last timestamp from raw events (guaranteed non-empty)
-            last_ts = raw_events[-1].get("timestamp", job_started.timestamp)
-            state = TranscriptionState(
-                pdf_source=job_started.pdf_path,
-                total_pages=job_started.total_pages,
-                completed_pages=all_completed,
-                failed_pages=failed_pages,
-                output_format="markdown",  # hardcoded for now
-                quality=job_started.quality,
-                started_at=job_started.timestamp,
-                last_updated=last_ts,
-            )
+            offset, state = self._checkpoint or self._load_snapshot() or (0, None)
+            raw_events, end_offset = read_event_log_from(self.events_log, offset)
+
+            if state is None:
+                if not raw_events:
+                    return self.load_state()
+
+                # Find job_started event
+                job_started = None
+                for raw in raw_events:
+                    if raw.get("event_type") != "job_started":
+                        continue
+                    try:
+                        event = parse_event(raw)
+                    except (ValueError, KeyError):
+                        continue
+                    if isinstance(event, JobStartedEvent):
+                        job_started = event
+                        break
+
+                if not job_started:
+                    logger.warning("No job_started event found, falling back to state.json")
+                    return self.load_state()
+
+                state = TranscriptionState(
+                    pdf_source=job_started.pdf_path,
+                    total_pages=job_started.total_pages,
+                    completed_pages=[],
+                    failed_pages=[],
+                    output_format="markdown",  # hardcoded for now
+                    quality=job_started.quality,
+                    started_at=job_started.timestamp,
+                    last_updated=job_started.timestamp,
+                )
+
+            _apply_events(state, raw_events)
+            self._checkpoint = (end_offset, state)
 
             logger.info(
                 f"Loaded state from events: {len(state.completed_pages)}/{state.total_pages} "
                 f"pages complete"
             )
-            return state
+            # Callers mutate the returned state; keep the checkpoint private
+            return TranscriptionState.from_dict(state.to_dict())
 
         except Exception as e:
             logger.error(f"Failed to load state from events: {e}")
             return self.load_state()
 
+    def snapshot(self) -> None:
+        """
+        Persist the replay checkpoint to snapshot.json.
+
+        A later resume loads the snapshot and replays only the events
+        logged after it, instead of the whole event log.
+        """
+        if self._checkpoint is None:
+            return
+
+        offset, state = self._checkpoint
+        try:
+            self.progress_dir.mkdir(parents=True, exist_ok=True)
+            self.snapshot_file.write_text(
+                json.dumps({"events_offset": offset, "state": state.to_dict()}),
+                encoding="utf-8"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write state snapshot: {e}")
+
+    def _load_snapshot(self) -> tuple[int, TranscriptionState] | None:
+        """Load the persisted replay checkpoint if it matches the event log."""
+        if not self.snapshot_file.exists():
+            return None
+
+        try:
+            data = json.loads(self.snapshot_file.read_text(encoding="utf-8"))
+            offset = int(data["events_offset"])
+            state = TranscriptionState.from_dict(data["state"])
+        except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring corrupt state snapshot: {e}")
+            return None
+
+        # A log shorter than the checkpoint was truncated or replaced
+        if self.events_log.stat().st_size < offset:
+            logger.info("Event log shorter than snapshot, replaying in full")
+            return None
+
+        return offset, state
+
     def load_state(self) -> TranscriptionState | None:
         """
         Load existing state for resume.
@@ -160,6 +240,10 @@ class StateManager:
         Returns:
             TranscriptionState if exists, None otherwise
         """
+        # Unflushed page completions are newer than what's on disk
+        if self._pending_state is not None:
+            return self._pending_state
+
         if not self.state_file.exists():
             return None
 
@@ -195,6 +279,10 @@ class StateManager:
         """
         self.progress_dir.mkdir(parents=True, exist_ok=True)
 
+        # A new job invalidates any replay checkpoint from a previous run
+        self._checkpoint = None
+        self.snapshot_file.unlink(missing_ok=True)
+
         now = datetime.utcnow().isoformat() + "Z"
         state = TranscriptionState(
             pdf_source=pdf_source,
@@ -238,7 +326,7 @@ class StateManager:
         page_file = self.progress_dir / f"page_{page_num:03d}.md"
         page_file.write_text(content, encoding="utf-8")
 
-        self._save_state(state)
+        self._save_state_batched(state)
         logger.info(
             f"Page {page_num} complete ({len(state.completed_pages)}/{state.total_pages})"
         )
@@ -336,6 +424,11 @@ class StateManager:
         self._save_state(state)
         logger.info(f"Chunk complete (through page {last_page})")
 
+        self._chunks_since_snapshot += 1
+        if self.snapshot_every and self._chunks_since_snapshot >= self.snapshot_every:
+            self.snapshot()
+            self._chunks_since_snapshot = 0
+
     def assemble_output(self, include_page_markers: bool = True) -> str:
         """
         Combine all completed pages into final output.
@@ -402,8 +495,17 @@ class StateManager:
             last_updated=state.last_updated,
         )
 
+    def flush_batch(self) -> None:
+        """Write any state held back by batching to state.json."""
+        if self._pending_state is not None:
+            self._save_state(self._pending_state)
+
     def cleanup(self) -> None:
         """Remove progress directory after successful completion."""
+        # Nothing left to flush once the progress directory is gone
+        self._pending_state = None
+        self._pending_pages = 0
+
         if self.progress_dir.exists():
             try:
                 shutil.rmtree(self.progress_dir)
@@ -411,6 +513,13 @@ class StateManager:
             except Exception as e:
                 logger.warning(f"Failed to cleanup progress directory: {e}")
 
+    def _save_state_batched(self, state: TranscriptionState) -> None:
+        """Record state, writing it only every flush_every calls."""
+        self._pending_state = state
+        self._pending_pages += 1
+        if self._pending_pages >= self.flush_every:
+            self.flush_batch()
+
     def _save_state(self, state: TranscriptionState) -> None:
         """Save state to JSON file."""
         try:
@@ -421,3 +530,6 @@ class StateManager:
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
             raise
+
+        self._pending_state = None
+        self._pending_pages = 0
@@ -11,9 +11,10 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncIterator, Literal, Union
+from typing import Any, AsyncIterator, Callable, Iterator, Literal, Union
 import json
 import logging
+import os
 import threading
 import time
 
@@ -31,6 +32,26 @@ from pdf_transcriber.event_types import (  # noqa: F401
     JobCompletedEvent,
 )
 
+# orjson (optional, `pip install pdf-transcriber[fast]`) decodes event lines
+# several times faster than the stdlib. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so the readers' error handling is unchanged.
+_json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    _json_loads = json.loads
+
+
+def _dumps_line(obj: dict[str, Any]) -> bytes:
+    """Encode one event as a newline-terminated JSONL line."""
+    if orjson is not None:
+        line: bytes = orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        return line
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
 # Union of all typed event dataclasses
 Event = Union[JobStartedEvent, PageCompletedEvent, HeartbeatEvent, ErrorEvent, JobCompletedEvent]
 
@@ -102,9 +123,7 @@ class EventEmitter:
         # Create symlink in output directory
         self._create_symlink()
 
-        # Heartbeat thread state
-        self._heartbeat_thread: threading.Thread | None = None
-        self._heartbeat_stop_event = threading.Event()
+        # Heartbeat state (emission runs on the shared dispatcher thread)
         self._heartbeat_interval = 30  # seconds
         self._current_page = 0
         self._pages_at_last_heartbeat = 0
@@ -137,9 +156,14 @@ class EventEmitter:
             event: Event to write
         """
         try:
-            event_json = json.dumps(event.to_dict())
-            with open(self.central_log_path, 'a', encoding='utf-8') as f:
-                f.write(event_json + '\n')
+            line = _dumps_line(event.to_dict())
+            # One write() on an O_APPEND descriptor: the heartbeat thread and
+            # the transcription loop can't interleave partial lines
+            fd = os.open(self.central_log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
         except Exception as e:
             logger.error(f"Failed to write event: {e}")
 
@@ -314,43 +338,23 @@ class EventEmitter:
 
     def start_heartbeat(self, total_pages: int) -> None:
         """
-        Start background heartbeat thread.
+        Start periodic heartbeats on the shared background thread.
 
         Args:
             total_pages: Total pages in document (for heartbeat events)
         """
-        if self._heartbeat_thread is not None:
-            logger.warning("Heartbeat thread already running")
+        if not _heartbeats.register(self, total_pages):
+            logger.warning("Heartbeat already running")
             return
 
-        self._heartbeat_stop_event.clear()
-        self._heartbeat_thread = threading.Thread(
-            target=self._heartbeat_loop,
-            args=(total_pages,),
-            daemon=True
-        )
-        self._heartbeat_thread.start()
-        logger.info(f"Started heartbeat thread (interval: {self._heartbeat_interval}s)")
+        logger.info(f"Started heartbeat (interval: {self._heartbeat_interval}s)")
 
     def stop_heartbeat(self) -> None:
-        """Stop background heartbeat thread."""
-        if self._heartbeat_thread is None:
+        """Stop periodic heartbeats for this emitter."""
+        if not _heartbeats.unregister(self):
             return
 
-        self._heartbeat_stop_event.set()
-        self._heartbeat_thread.join(timeout=2.0)
-        self._heartbeat_thread = None
-        logger.info("Stopped heartbeat thread")
-
-    def _heartbeat_loop(self, total_pages: int) -> None:
-        """
-        Heartbeat thread main loop.
-
-        Args:
-            total_pages: Total pages in document
-        """
-        while not self._heartbeat_stop_event.wait(self._heartbeat_interval):
-            self.emit_heartbeat(self._current_page, total_pages)
+        logger.info("Stopped heartbeat")
 
     def update_current_page(self, page_number: int) -> None:
         """
@@ -420,6 +424,85 @@ class EventEmitter:
             self.stop_heartbeat()
 
 
+class _HeartbeatDispatcher:
+    """
+    One daemon thread that emits heartbeats for every active emitter.
+
+    Emitters register with their total page count; the thread sleeps until
+    the earliest one is due. Concurrent and back-to-back jobs share this
+    thread instead of each spawning and joining their own.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # Serializes emission so unregister() can wait out an in-flight heartbeat
+        self._emit_lock = threading.Lock()
+        # emitter -> (total_pages, monotonic time next heartbeat is due)
+        self._jobs: dict[EventEmitter, tuple[int, float]] = {}
+        self._thread: threading.Thread | None = None
+
+    def register(self, emitter: EventEmitter, total_pages: int) -> bool:
+        """Start heartbeats for an emitter. Returns False if already registered."""
+        with self._cond:
+            if emitter in self._jobs:
+                return False
+            due = time.monotonic() + emitter._heartbeat_interval
+            self._jobs[emitter] = (total_pages, due)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="pdf-transcriber-heartbeat",
+                    daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def unregister(self, emitter: EventEmitter) -> bool:
+        """
+        Stop heartbeats for an emitter. Returns False if it wasn't registered.
+
+        Once this returns, no further heartbeat is written for the emitter.
+        """
+        with self._cond:
+            if self._jobs.pop(emitter, None) is None:
+                return False
+            self._cond.notify()
+        # Wait for a heartbeat that may be mid-write for this emitter
+        with self._emit_lock:
+            pass
+        return True
+
+    def _run(self) -> None:
+        """Dispatcher thread main loop."""
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                due = [
+                    emitter for emitter, (_, next_due) in self._jobs.items()
+                    if next_due <= now
+                ]
+                if not due:
+                    next_due = min((t for _, t in self._jobs.values()), default=None)
+                    self._cond.wait(None if next_due is None else next_due - now)
+                    continue
+
+            with self._emit_lock:
+                for emitter in due:
+                    with self._cond:
+                        job = self._jobs.get(emitter)
+                        if job is None:
+                            continue  # Unregistered since it became due
+                        total_pages, _ = job
+                        self._jobs[emitter] = (
+                            total_pages, time.monotonic() + emitter._heartbeat_interval
+                        )
+                    emitter.emit_heartbeat(emitter._current_page, total_pages)
+
+
+_heartbeats = _HeartbeatDispatcher()
+
+
 @dataclass
 class ProgressTracker:
     """Mutable progress state shared between the job CM and callers.
@@ -432,20 +515,21 @@ class ProgressTracker:
     pages_failed: int = 0
 
 
-def read_event_log(log_path: Path) -> list[dict[str, Any]]:
+def iter_event_log(log_path: Path) -> Iterator[dict[str, Any]]:
     """
-    Read and parse event log.
+    Yield parsed events one at a time, in log order.
+
+    Streaming counterpart of read_event_log() for callers that fold events
+    as they go and never need the whole list in memory.
 
     Args:
         log_path: Path to events.jsonl file
 
-    Returns:
-        List of event dictionaries (parsed JSON)
+    Yields:
+        Event dictionaries (parsed JSON)
     """
-    events = []
-
     if not log_path.exists():
-        return events
+        return
 
     try:
         with open(log_path, 'r', encoding='utf-8') as f:
@@ -455,14 +539,35 @@ def read_event_log(log_path: Path) -> list[dict[str, Any]]:
                     continue
 
                 try:
-                    event = json.loads(line)
-                    events.append(event)
+                    event = _json_loads(line)
                 except json.JSONDecodeError as e:
                     logger.warning(f"Skipping malformed event at line {line_num}: {e}")
+                    continue
+                yield event
     except Exception as e:
         logger.error(f"Failed to read event log: {e}")
 
-    return events
+
+def iter_event_log_typed(log_path: Path) -> Iterator[Event]:
+    """Typed counterpart of iter_event_log(); skips unparseable events."""
+    for raw in iter_event_log(log_path):
+        try:
+            yield parse_event(raw)
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Skipping unparseable event: {e}")
+
+
+def read_event_log(log_path: Path) -> list[dict[str, Any]]:
+    """
+    Read and parse event log.
+
+    Args:
+        log_path: Path to events.jsonl file
+
+    Returns:
+        List of event dictionaries (parsed JSON)
+    """
+    return list(iter_event_log(log_path))
 
 
 def read_event_log_typed(log_path: Path) -> list[Event]:
@@ -477,13 +582,136 @@ def read_event_log_typed(log_path: Path) -> list[Event]:
     Returns:
         List of typed event instances
     """
+    return list(iter_event_log_typed(log_path))
+
+
+def read_event_log_from(log_path: Path, offset: int = 0) -> tuple[list[dict[str, Any]], int]:
+    """
+    Parse event log lines starting at a byte offset.
+
+    Lets callers that poll a growing log parse only what was appended since
+    their last read. A trailing partial line (writer mid-append) is left for
+    the next call.
+
+    Args:
+        log_path: Path to events.jsonl file
+        offset: Byte offset to start reading from (must be a line boundary)
+
+    Returns:
+        Tuple of (raw event dicts, offset just past the last consumed line)
+    """
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        try:
+            _json_loads(data[end:])
+            end = len(data)
+        except json.JSONDecodeError:
+            pass
+
+    events = []
+    for line_num, line in enumerate(data[:end].splitlines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            events.append(_json_loads(line))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed event at line {line_num}: {e}")
+
+    return events, offset + end
+
+
+def read_event_log_typed_from(log_path: Path, offset: int = 0) -> tuple[list[Event], int]:
+    """Typed counterpart of read_event_log_from().
+
+    Args:
+        log_path: Path to events.jsonl file
+        offset: Byte offset to start reading from (must be a line boundary)
+
+    Returns:
+        Tuple of (typed event instances, offset just past the last consumed line)
+    """
+    raw_events, offset = read_event_log_from(log_path, offset)
     typed_events: list[Event] = []
-    for raw in read_event_log(log_path):
+    for raw in raw_events:
         try:
             typed_events.append(parse_event(raw))
         except (ValueError, KeyError) as e:
             logger.warning(f"Skipping unparseable event: {e}")
-    return typed_events
+    return typed_events, offset
+
+
+def iter_event_log_reversed(
+    log_path: Path,
+    chunk_size: int = 8192,
+    contains: bytes | None = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield raw events newest-first, reading the log backwards in chunks.
+
+    Callers that only need the end of a log (recent events, the last few
+    errors, whether the job completed) can stop early instead of parsing
+    the whole file.
+
+    Args:
+        log_path: Path to events.jsonl file
+        chunk_size: Bytes to read per backward step
+        contains: If given, only lines containing these bytes are parsed;
+            the rest are skipped without a JSON decode
+
+    Yields:
+        Event dictionaries (parsed JSON), last line first
+    """
+    if not log_path.exists():
+        return
+
+    with open(log_path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        head = b""
+        while pos > 0:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + head).split(b"\n")
+            # The first piece may continue in the previous chunk
+            head = lines[0]
+            for line in reversed(lines[1:]):
+                if contains is not None and contains not in line:
+                    continue
+                event = _parse_line(line)
+                if event is not None:
+                    yield event
+
+        if contains is None or contains in head:
+            event = _parse_line(head)
+            if event is not None:
+                yield event
+
+
+def iter_event_log_typed_reversed(log_path: Path) -> Iterator[Event]:
+    """Typed counterpart of iter_event_log_reversed()."""
+    for raw in iter_event_log_reversed(log_path):
+        try:
+            yield parse_event(raw)
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Skipping unparseable event: {e}")
+
+
+def _parse_line(line: bytes) -> dict[str, Any] | None:
+    """Parse one JSONL line, or None if it is blank or malformed."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event: dict[str, Any] = _json_loads(line)
+    except json.JSONDecodeError as e:
+        logger.warning(f"Skipping malformed event: {e}")
+        return None
+    return event
 
 
 def get_last_completed_page(events: list[dict[str, Any]]) -> int:
@@ -1,10 +1,14 @@
 """transcribe_pdf tool implementation."""
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Any
+import asyncio
 import logging
+import shutil
+import sys
+import time
 
 from pdf_transcriber.config import Config
-from pdf_transcriber.core.pdf_processor import PDFProcessor
-from pdf_transcriber.core.engine_cache import get_transcription_engine, clear_engine_cache
 from pdf_transcriber.core.state_manager import StateManager
 from pdf_transcriber.core.metadata_parser import (
     create_initial_metadata,
@@ -15,10 +19,91 @@ from pdf_transcriber.events import EventEmitter
 
 logger = logging.getLogger(__name__)
 
+# Maps paper-name characters that can't appear in a job_id to hyphens
+_JOB_ID_TABLE = str.maketrans({" ": "-", ".": "-"})
+
+# Completed pages per state.json rewrite within a chunk
+_STATE_FLUSH_EVERY = 8
+
+# Chunk checkpoints between event-replay snapshots (resume replays only the tail)
+_SNAPSHOT_EVERY_CHUNKS = 10
+
+# Shape of every failed transcribe_pdf result; _fail() fills in the specifics
+_BASE_FAIL: dict[str, Any] = {
+    "success": False,
+    "output_path": None,
+    "pages_transcribed": 0,
+    "total_pages": 0,
+    "partial_content": None,
+    "error": None,
+    "metadata": {},
+    "lint_results": None
+}
+
+
+def _fail(error: str, **overrides) -> dict:
+    """Build a failed transcribe_pdf result from the shared template."""
+    # Fresh metadata dict so callers never share the template's instance
+    return {**_BASE_FAIL, "metadata": {}, "error": error, **overrides}
+
+
+def _write_markdown(path: Path, frontmatter: str, content: str) -> None:
+    """Write frontmatter and body without building a concatenated copy."""
+    with path.open("w", encoding="utf-8") as f:
+        f.write(frontmatter)
+        f.write("\n")
+        f.write(content)
+
+
+class _EngineKeepalive:
+    """
+    Track transcription engine use and free cached engines once idle.
+
+    With idle_ttl > 0, a background task clears the engine cache after no
+    job has used it for idle_ttl seconds; calls within that window reuse
+    the warm engine. idle_ttl <= 0 keeps engines until explicitly cleared.
+    """
+
+    def __init__(self, idle_ttl: float):
+        self.idle_ttl = idle_ttl
+        self.active_jobs = 0
+        self.last_used = time.monotonic()
+        self._reaper: asyncio.Task | None = None
+
+    def acquire(self) -> None:
+        """Mark the engine as in use by a job."""
+        self.active_jobs += 1
+
+    def release(self) -> None:
+        """Mark a job as finished and arm the idle reaper."""
+        self.active_jobs -= 1
+        self.last_used = time.monotonic()
+        if self.idle_ttl > 0 and (self._reaper is None or self._reaper.done()):
+            self._reaper = asyncio.get_running_loop().create_task(self._reap())
+
+    async def _reap(self) -> None:
+        """Clear the engine cache once it has been idle for idle_ttl seconds."""
+        from pdf_transcriber.core.engine_cache import clear_engine_cache
+
+        while True:
+            idle = time.monotonic() - self.last_used
+            if self.active_jobs == 0 and idle >= self.idle_ttl:
+                count = clear_engine_cache()
+                if count:
+                    logger.info(f"Freed {count} idle engine(s) after {self.idle_ttl:.0f}s")
+                return
+            await asyncio.sleep(max(self.idle_ttl - idle, 1.0))
+
 
 def register(mcp, config: Config):
     """Register transcribe_pdf tool with MCP server."""
 
+    engine_lock = asyncio.Lock()
+    keepalive = _EngineKeepalive(config.engine_idle_ttl)
+    # Presets are fixed for the server's lifetime; resolve them once
+    dpi_by_quality = {q: config.get_dpi(q) for q in config.quality_presets}
+    quality_keys = list(config.quality_presets)
+
     @mcp.tool()
     async def transcribe_pdf(
         pdf_path: str,
@@ -69,132 +154,158 @@ def register(mcp, config: Config):
                 }
             }
         """
-        # Validate and expand paths
+        # Cheap argument checks first, before touching the filesystem
+        if quality not in dpi_by_quality:
+            return _fail(
+                f"Invalid quality: {quality}. Must be one of {quality_keys}"
+            )
+
+        # Validate and expand paths. This single stat is the only existence
+        # check; PDFProcessor is told to skip its own. Resolved per call:
+        # cwd, HOME and symlink targets can change in the long-lived server.
         pdf_path = Path(pdf_path).expanduser().resolve()
         if not pdf_path.exists():
-            return {
-                "success": False,
-                "output_path": None,
-                "pages_transcribed": 0,
-                "total_pages": 0,
-                "partial_content": None,
-                "error": f"PDF not found: {pdf_path}",
-                "metadata": {},
-                "lint_results": None
-            }
+            return _fail(f"PDF not found: {pdf_path}")
 
-        if quality not in config.quality_presets:
-            return {
-                "success": False,
-                "output_path": None,
-                "pages_transcribed": 0,
-                "total_pages": 0,
-                "partial_content": None,
-                "error": f"Invalid quality: {quality}. Must be one of {list(config.quality_presets.keys())}",
-                "metadata": {},
-                "lint_results": None
-            }
+        # Deferred so registering the tools doesn't load PyMuPDF up front
+        from pdf_transcriber.core.engine_cache import get_transcription_engine
+        from pdf_transcriber.core.pdf_processor import PDFProcessor
 
         # Determine output location
-        paper_name = pdf_path.stem
+        paper_name = sys.intern(pdf_path.stem)
         out_dir = Path(output_dir).expanduser() if output_dir else config.output_dir
         paper_dir = out_dir / paper_name
         paper_dir.mkdir(parents=True, exist_ok=True)
 
         # Get DPI from quality preset
-        dpi = config.get_dpi(quality)
+        dpi = dpi_by_quality[quality]
 
         logger.info(
             f"Starting transcription: {pdf_path.name} "
             f"(quality={quality}/{dpi}dpi, mode={mode})"
         )
 
-        # Initialize state manager
-        state_mgr = StateManager(out_dir, paper_name)
+        # Initialize state manager. Page-level state.json writes are batched;
+        # the engine's chunk checkpoints still write at every chunk boundary
+        # and periodically snapshot the event replay for fast resume.
+        state_mgr = StateManager(
+            out_dir, paper_name,
+            flush_every=_STATE_FLUSH_EVERY,
+            snapshot_every=_SNAPSHOT_EVERY_CHUNKS
+        )
 
         # Initialize event emitter (job_id derived from paper_name)
-        job_id = paper_name.lower().replace(" ", "-").replace(".", "-")
+        job_id = sys.intern(paper_name.lower().translate(_JOB_ID_TABLE))
         event_emitter = EventEmitter(job_id, paper_dir)
 
-        # Check for existing job
-        is_resume = False
-        if resume and state_mgr.has_existing_job():
-            # Try event-based resume first
-            state = state_mgr.load_state_from_events()
-            if state:
-                is_resume = True
-                logger.info(
-                    f"Resuming job: {len(state.completed_pages)}/{state.total_pages} "
-                    f"pages done"
-                )
+        # The PDF is opened once: the same handle serves page counting and
+        # transcription, for both fresh and resumed jobs.
+        with ExitStack() as stack:
+            # Check for existing job
+            is_resume = False
+            if resume and state_mgr.has_existing_job():
+                # Try event-based resume first
+                state = state_mgr.load_state_from_events()
+                if state:
+                    is_resume = True
+                    logger.info(
+                        f"Resuming job: {len(state.completed_pages)}/{state.total_pages} "
+                        f"pages done"
+                    )
 
-        if not is_resume:
-            # Start fresh
             try:
-                with PDFProcessor(str(pdf_path), dpi) as proc:
-                    total_pages = proc.total_pages
+                proc = stack.enter_context(PDFProcessor(pdf_path, dpi, validate=False))
             except Exception as e:
-                return {
-                    "success": False,
-                    "output_path": None,
-                    "pages_transcribed": 0,
-                    "total_pages": 0,
-                    "partial_content": None,
-                    "error": f"Failed to open PDF: {e}",
-                    "metadata": {},
-                    "lint_results": None
-                }
-
-            state = state_mgr.create_job(
-                str(pdf_path), total_pages, "markdown", quality
-            )
-
-            # Emit job_started event (only for new jobs, not resume)
-            event_emitter.emit_job_started(
-                pdf_path=str(pdf_path),
-                output_dir=str(paper_dir),
-                total_pages=total_pages,
-                quality=quality,
-                mode=mode,
-                metadata=metadata or {}
-            )
+                if not is_resume:
+                    return _fail(f"Failed to open PDF: {e}")
+                # A resumed job's log is still open: close it out the way a
+                # failed transcription would, so the dashboard sees it end
+                logger.error(f"Failed to open PDF: {e}")
+                event_emitter.emit_error(
+                    severity="error",
+                    error_type="transcription_failure",
+                    error_message=str(e)
+                )
+                progress = state_mgr.get_progress_summary()
+                event_emitter.emit_job_completed(
+                    total_pages=progress.total,
+                    pages_completed=progress.completed,
+                    pages_failed=progress.failed,
+                )
+                event_emitter.stop_heartbeat()
+                return _fail(
+                    f"Failed to open PDF: {e}",
+                    pages_transcribed=progress.completed,
+                    total_pages=progress.total
+                )
 
-        # Get transcription engine (cached to avoid reloading models)
-        engine = get_transcription_engine(
-            use_gpu=config.use_gpu,
-            batch_size=config.marker_batch_size,
-            langs=config.marker_langs,
-            # LLM-enhanced OCR settings
-            use_llm=config.use_llm,
-            llm_service=config.llm_service,
-            ollama_base_url=config.ollama_base_url,
-            ollama_model=config.ollama_model,
-            openai_base_url=config.openai_base_url,
-            openai_api_key=config.openai_api_key,
-            openai_model=config.openai_model
-        )
+            if not is_resume:
+                # Start fresh
+                total_pages = proc.total_pages
+                state = state_mgr.create_job(
+                    str(pdf_path), total_pages, "markdown", quality
+                )
 
-        # Determine actual chunk size (auto-chunking logic)
-        if chunk_size is not None:
-            # Explicit chunk_size: use it (0 = disable chunking)
-            actual_chunk_size = chunk_size
-        elif state.total_pages > config.auto_chunk_threshold:
-            # Large PDF: auto-enable chunking with default size
-            actual_chunk_size = config.chunk_size
-            logger.info(
-                f"Auto-chunking enabled: {state.total_pages} pages > "
-                f"{config.auto_chunk_threshold} threshold (chunk_size={actual_chunk_size})"
-            )
-        else:
-            # Small PDF: process all at once
-            actual_chunk_size = 0
+                # Emit job_started event (only for new jobs, not resume)
+                event_emitter.emit_job_started(
+                    pdf_path=str(pdf_path),
+                    output_dir=str(paper_dir),
+                    total_pages=total_pages,
+                    quality=quality,
+                    mode=mode,
+                    metadata=metadata or {}
+                )
 
-        # Transcribe + post-process. The finally block guarantees
-        # job_completed + stop_heartbeat even if post-processing crashes.
-        result = None
-        try:
+            # Get transcription engine (cached to avoid reloading models).
+            # Loading runs off the event loop; the lock makes concurrent
+            # calls wait for one model load instead of starting their own.
+            # The job counts as active before the load starts, so an armed
+            # idle reaper can't clear the cache while it is being fetched.
+            async with engine_lock:
+                keepalive.acquire()
+                engine = None
+                try:
+                    engine = await asyncio.to_thread(
+                        get_transcription_engine,
+                        use_gpu=config.use_gpu,
+                        batch_size=config.marker_batch_size,
+                        langs=config.marker_langs,
+                        # LLM-enhanced OCR settings
+                        use_llm=config.use_llm,
+                        llm_service=config.llm_service,
+                        ollama_base_url=config.ollama_base_url,
+                        ollama_model=config.ollama_model,
+                        openai_base_url=config.openai_base_url,
+                        openai_api_key=config.openai_api_key,
+                        openai_model=config.openai_model
+                    )
+                finally:
+                    # A failed load releases here; once loaded, the
+                    # transcription finally block below releases
+                    if engine is None:
+                        keepalive.release()
+
+            # Determine actual chunk size (auto-chunking logic)
+            if chunk_size is not None:
+                # Explicit chunk_size: use it (0 = disable chunking)
+                actual_chunk_size = chunk_size
+            elif state.total_pages > config.auto_chunk_threshold:
+                # Large PDF: auto-enable chunking with default size
+                actual_chunk_size = config.chunk_size
+                logger.info(
+                    f"Auto-chunking enabled: {state.total_pages} pages > "
+                    f"{config.auto_chunk_threshold} threshold (chunk_size={actual_chunk_size})"
+                )
+            else:
+                # Small PDF: process all at once
+                actual_chunk_size = 0
+
+            # Transcribe + post-process. The finally block guarantees
+            # job_completed + stop_heartbeat even if post-processing crashes.
+            result = None
+            summary = None  # Computed once after transcription; reused in finally
             try:
-                with PDFProcessor(str(pdf_path), dpi) as proc:
+                try:
                     if mode == "streaming":
                         content = await engine.transcribe_streaming(
                             proc, "markdown", state_mgr,
@@ -207,145 +318,153 @@ def register(mcp, config: Config):
                             event_emitter=event_emitter
                         )
                     else:
-                        result = {
-                            "success": False,
-                            "output_path": None,
-                            "pages_transcribed": 0,
-                            "total_pages": state.total_pages,
-                            "partial_content": None,
-                            "error": f"Invalid mode: {mode}. Must be 'streaming' or 'batch'",
-                            "metadata": {},
-                            "lint_results": None
-                        }
+                        result = _fail(
+                            f"Invalid mode: {mode}. Must be 'streaming' or 'batch'",
+                            total_pages=state.total_pages
+                        )
                         return result
 
-            except Exception as e:
-                # Return partial result on failure
-                partial = state_mgr.assemble_output()
-                logger.error(f"Transcription failed: {e}")
+                except Exception as e:
+                    # Return partial result on failure
+                    partial = state_mgr.assemble_output()
+                    logger.error(f"Transcription failed: {e}")
+
+                    event_emitter.emit_error(
+                        severity="error",
+                        error_type="transcription_failure",
+                        error_message=str(e)
+                    )
 
-                event_emitter.emit_error(
-                    severity="error",
-                    error_type="transcription_failure",
-                    error_message=str(e)
-                )
+                    summary = state_mgr.get_progress_summary()
+                    result = _fail(
+                        f"Transcription failed: {e}",
+                        pages_transcribed=summary.completed,
+                        total_pages=summary.total,
+                        partial_content=partial if partial else None,
+                        metadata=metadata or {}
+                    )
+                    return result
 
                 summary = state_mgr.get_progress_summary()
-                result = {
-                    "success": False,
-                    "output_path": None,
-                    "pages_transcribed": summary.completed,
-                    "total_pages": summary.total,
-                    "partial_content": partial if partial else None,
-                    "error": f"Transcription failed: {e}",
-                    "metadata": metadata or {},
-                    "lint_results": None
-                }
-                return result
 
-            # Build metadata — pass all user-supplied fields through
-            meta_dict = metadata or {}
-            paper_title = meta_dict.get("title", paper_name)
+                # Build metadata — pass all user-supplied fields through.
+                # Pop title off a copy (positional arg), forward everything else.
+                meta_kwargs = dict(metadata or {})
+                paper_title = meta_kwargs.pop("title", paper_name)
+
+                paper_meta = create_initial_metadata(
+                    title=paper_title,
+                    pdf_source=pdf_path,
+                    total_pages=state.total_pages,
+                    output_format="markdown",
+                    quality=quality,
+                    **meta_kwargs
+                )
 
-            # Extract title separately (positional arg), forward everything else
-            meta_kwargs = {k: v for k, v in meta_dict.items() if k != "title"}
+                # Update transcribed_pages count
+                paper_meta.transcribed_pages = summary.completed
 
-            paper_meta = create_initial_metadata(
-                title=paper_title,
-                pdf_source=pdf_path,
-                total_pages=state.total_pages,
-                output_format="markdown",
-                quality=quality,
-                **meta_kwargs
-            )
+                # Write final output with frontmatter
+                output_path = paper_dir / f"{paper_name}.md"
+                original_path = paper_dir / f"{paper_name}.original.md"
 
-            # Update transcribed_pages count
-            summary = state_mgr.get_progress_summary()
-            paper_meta.transcribed_pages = summary.completed
+                try:
+                    # File I/O runs in worker threads to keep the MCP loop responsive
+                    frontmatter = generate_frontmatter(paper_meta)
+                    if lint:
+                        # Write the pre-lint text once and byte-copy it, so the
+                        # linter's fix is the only rewrite of output_path. A
+                        # hardlink won't do: lint_file rewrites in place and
+                        # would change the original through the shared inode.
+                        await asyncio.to_thread(
+                            _write_markdown, original_path, frontmatter, content
+                        )
+                        await asyncio.to_thread(shutil.copyfile, original_path, output_path)
+                    else:
+                        await asyncio.to_thread(
+                            _write_markdown, output_path, frontmatter, content
+                        )
+                except Exception as e:
+                    result = _fail(
+                        f"Failed to write output file: {e}",
+                        pages_transcribed=summary.completed,
+                        total_pages=summary.total,
+                        partial_content=content,
+                        metadata=paper_meta.to_dict()
+                    )
+                    return result
 
-            # Write final output with frontmatter
-            output_path = paper_dir / f"{paper_name}.md"
+                # Cleanup progress files on success
+                if summary.completed == summary.total:
+                    state_mgr.cleanup()
+
+                logger.info(
+                    f"Transcription complete: {output_path} "
+                    f"({summary.completed}/{summary.total} pages)"
+                )
+
+                # Run linting if enabled
+                lint_results = None
+                if lint:
+                    try:
+                        # Original (non-linted) version was saved above for manual review
+                        logger.info(f"Saved original (pre-lint) to: {original_path}")
+
+                        # Run linter with auto-fix
+                        lint_report = await lint_engine.lint_file(output_path, fix=True)
+                        lint_results = {
+                            "total_issues": lint_report.total_issues,
+                            "auto_fixed": len(lint_report.fixed),
+                            "warnings": lint_report.warnings,
+                            "fixed_rules": lint_report.fixed,
+                            "original_path": str(original_path)
+                        }
+
+                        logger.info(
+                            f"Linting: {lint_report.total_issues} issues found, "
+                            f"{len(lint_report.fixed)} auto-fixed. "
+                            f"Original saved to {original_path.name}"
+                        )
+
+                    except Exception as e:
+                        logger.warning(f"Linting failed (file still saved): {e}")
+                        lint_results = {"error": str(e)}
 
-            try:
-                final_content = generate_frontmatter(paper_meta) + "\n" + content
-                output_path.write_text(final_content, encoding="utf-8")
-            except Exception as e:
                 result = {
-                    "success": False,
-                    "output_path": None,
+                    "success": True,
+                    "output_path": str(output_path),
                     "pages_transcribed": summary.completed,
                     "total_pages": summary.total,
-                    "partial_content": content,
-                    "error": f"Failed to write output file: {e}",
-                    "metadata": paper_meta.to_dict(),
-                    "lint_results": None
+                    "partial_content": None,
+                    "error": None,
+                    "metadata": {
+                        "title": paper_meta.title,
+                        "authors": paper_meta.authors,
+                        "keywords": paper_meta.keywords,
+                        "year": paper_meta.year
+                    },
+                    "lint_results": lint_results
                 }
                 return result
 
-            # Cleanup progress files on success
-            if summary.completed == summary.total:
-                state_mgr.cleanup()
-
-            logger.info(
-                f"Transcription complete: {output_path} "
-                f"({summary.completed}/{summary.total} pages)"
-            )
-
-            # Run linting if enabled
-            lint_results = None
-            if lint:
+            finally:
+                # Persist any batched page state before reporting completion.
+                # A failed write must not skip the guaranteed steps below.
                 try:
-                    # Save original (non-linted) version for manual review
-                    original_path = paper_dir / f"{paper_name}.original.md"
-                    original_path.write_text(final_content, encoding="utf-8")
-                    logger.info(f"Saved original (pre-lint) to: {original_path}")
-
-                    # Run linter with auto-fix
-                    lint_report = await lint_engine.lint_file(output_path, fix=True)
-                    lint_results = {
-                        "total_issues": lint_report.total_issues,
-                        "auto_fixed": len(lint_report.fixed),
-                        "warnings": lint_report.warnings,
-                        "fixed_rules": lint_report.fixed,
-                        "original_path": str(original_path)
-                    }
-
-                    logger.info(
-                        f"Linting: {lint_report.total_issues} issues found, "
-                        f"{len(lint_report.fixed)} auto-fixed. "
-                        f"Original saved to {original_path.name}"
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Linting failed (file still saved): {e}")
-                    lint_results = {"error": str(e)}
-
-            result = {
-                "success": True,
-                "output_path": str(output_path),
-                "pages_transcribed": summary.completed,
-                "total_pages": summary.total,
-                "partial_content": None,
-                "error": None,
-                "metadata": {
-                    "title": paper_meta.title,
-                    "authors": paper_meta.authors,
-                    "keywords": paper_meta.keywords,
-                    "year": paper_meta.year
-                },
-                "lint_results": lint_results
-            }
-            return result
-
-        finally:
-            # Guarantee job_completed + stop_heartbeat (R1 + R4)
-            summary = state_mgr.get_progress_summary()
-            event_emitter.emit_job_completed(
-                total_pages=summary.total,
-                pages_completed=summary.completed,
-                pages_failed=summary.failed,
-            )
-            event_emitter.stop_heartbeat()
+                    state_mgr.flush_batch()
+                except OSError as e:
+                    logger.error(f"Failed to flush batched page state: {e}")
+
+                # Guarantee job_completed + stop_heartbeat (R1 + R4)
+                if summary is None:
+                    summary = state_mgr.get_progress_summary()
+                event_emitter.emit_job_completed(
+                    total_pages=summary.total,
+                    pages_completed=summary.completed,
+                    pages_failed=summary.failed,
+                )
+                event_emitter.stop_heartbeat()
+                keepalive.release()
 
     @mcp.tool()
     async def clear_transcription_cache() -> dict:
@@ -361,6 +480,8 @@ def register(mcp, config: Config):
             - cleared (int): Number of cached engines that were cleared
             - message (str): Status message
         """
+        from pdf_transcriber.core.engine_cache import clear_engine_cache
+
         count = clear_engine_cache()
 
         if count > 0:
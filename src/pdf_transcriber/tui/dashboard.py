@@ -1,8 +1,15 @@
 """Live TUI dashboard for monitoring PDF transcription jobs."""
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Iterator
 import logging
+import os
 import sys
+import threading
+import time
 
 from rich.console import Console
 from rich.layout import Layout
@@ -12,14 +19,15 @@ from rich.progress import BarColumn, Progress, TextColumn
 from rich.table import Table
 from rich.text import Text
 
-from pdf_transcriber.tui.discovery import discover_jobs, JobInfo
+from pdf_transcriber.tui.discovery import discover_jobs, event_log_fingerprint, JobInfo
 from pdf_transcriber.tui.metrics import (
     calculate_metrics,
     format_elapsed_time,
     format_eta,
-    format_completion_time
+    format_completion_time,
+    prune_metrics_cache
 )
-from pdf_transcriber.events import read_event_log_typed
+from pdf_transcriber.events import Event, iter_event_log_typed_reversed
 from pdf_transcriber.event_types import (
     ErrorEvent,
     PageCompletedEvent,
@@ -30,6 +38,48 @@ from pdf_transcriber.event_types import (
 
 logger = logging.getLogger(__name__)
 
+# Redraw at least this often even when no log changed, so "time ago",
+# elapsed and stall indicators stay current
+FORCED_REDRAW_SECONDS = 30
+
+# How often the UI loop checks for keys and for a new discovery snapshot
+KEY_POLL_SECONDS = 0.2
+
+# Progress bars are slices of one prebuilt run of bar characters
+PROGRESS_BAR_WIDTH = 30
+_PROGRESS_BAR = "━" * PROGRESS_BAR_WIDTH
+
+# DEC private mode 2026 (synchronized output): the terminal buffers a frame
+# between these and presents it at once, so redraws never show half-drawn
+BEGIN_SYNCHRONIZED_UPDATE = "\x1b[?2026h"
+END_SYNCHRONIZED_UPDATE = "\x1b[?2026l"
+
+# TERM_PROGRAM / TERM markers of terminals known to support mode 2026
+_SYNC_OUTPUT_TERM_PROGRAMS = ("ghostty", "iterm.app", "wezterm", "vscode", "contour")
+_SYNC_OUTPUT_TERMS = ("kitty", "foot", "ghostty", "wezterm", "contour")
+
+
+# Event class -> detail-view row text after the timestamp column
+_EVENT_ROW_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    PageCompletedEvent: lambda e: (
+        f"page_completed │ page {e.page_number}, {e.duration_ms / 1000:.1f}s"
+    ),
+    HeartbeatEvent: lambda e: (
+        f"heartbeat      │ page {e.current_page}, "
+        f"velocity {e.pages_completed_since_last_heartbeat} pg/30s"
+    ),
+    JobStartedEvent: lambda e: f"{e.event_type:14} │",
+    JobCompletedEvent: lambda e: f"{e.event_type:14} │",
+}
+
+
+@dataclass(frozen=True)
+class _JobsSnapshot:
+    """One discovery result, pre-split into the dashboard's two sections."""
+    jobs: list[JobInfo] = field(default_factory=list)
+    active: list[JobInfo] = field(default_factory=list)
+    recent: list[JobInfo] = field(default_factory=list)
+
 
 class DashboardView:
     """Main dashboard view for monitoring jobs."""
@@ -58,42 +108,134 @@ class DashboardView:
         self.console = Console()
         self.selected_index = 0
         self.viewing_detail = False
-        self.jobs: list[JobInfo] = []
+        # Latest discovery snapshot. Replaced wholesale (never mutated) so the
+        # discovery thread can swap it while the UI thread reads it.
+        self._snapshot = _JobsSnapshot()
+        # Set when a key or a new snapshot changes what should be on screen
+        self.dirty = True
+
+        # Background discovery (see start_discovery())
+        self._discovery_thread: threading.Thread | None = None
+        self._rediscover = threading.Event()
+        self._stop_discovery = threading.Event()
+
+    @property
+    def jobs(self) -> list[JobInfo]:
+        """All jobs from the latest discovery (active first)."""
+        return self._snapshot.jobs
+
+    def refresh_jobs(self, now: datetime | None = None) -> None:
+        """Rediscover jobs and swap in the new snapshot."""
+        jobs = discover_jobs(
+            self.output_dir, self.stale_threshold, self.recent_limit, now=now
+        )
+        # Partition once here rather than on every render and keypress
+        self._snapshot = _JobsSnapshot(
+            jobs=jobs,
+            active=[j for j in jobs if j.is_active],
+            recent=[j for j in jobs if not j.is_active][:self.recent_limit],
+        )
+        prune_metrics_cache(job.event_log_path for job in jobs)
+
+    def start_discovery(self) -> None:
+        """
+        Run discovery on a background thread from now on.
+
+        render() then only reads the latest snapshot, so filesystem scans and
+        log parsing never block key handling or drawing.
+        """
+        if self._discovery_thread is not None:
+            return
+        self._stop_discovery.clear()
+        self._discovery_thread = threading.Thread(
+            target=self._discovery_loop,
+            name="dashboard-discovery",
+            daemon=True
+        )
+        self._discovery_thread.start()
+
+    def stop_discovery(self) -> None:
+        """Stop the background discovery thread."""
+        if self._discovery_thread is None:
+            return
+        self._stop_discovery.set()
+        self._rediscover.set()
+        self._discovery_thread.join(timeout=2.0)
+        self._discovery_thread = None
+
+    def request_rediscovery(self) -> None:
+        """Have the discovery thread rescan now instead of at its next tick."""
+        self._rediscover.set()
+
+    def _discovery_loop(self) -> None:
+        """Discovery thread main loop."""
+        last_fingerprint = None
+        last_refresh = 0.0
+        while not self._stop_discovery.is_set():
+            forced = self._rediscover.is_set()
+            self._rediscover.clear()
+
+            # Rediscover only when a log changed, on request, or when the
+            # forced redraw interval has passed
+            fingerprint = event_log_fingerprint(self.output_dir)
+            now = time.monotonic()
+            if (
+                forced
+                or fingerprint != last_fingerprint
+                or now - last_refresh >= FORCED_REDRAW_SECONDS
+            ):
+                try:
+                    self.refresh_jobs()
+                except Exception as e:
+                    logger.warning(f"Job discovery failed: {e}")
+                last_fingerprint = fingerprint
+                last_refresh = now
+                self.dirty = True
+
+            self._rediscover.wait(self.refresh_interval)
 
     def render(self) -> Layout:
         """Render the current view."""
-        # Discover jobs
-        self.jobs = discover_jobs(self.output_dir, self.stale_threshold)
+        self.dirty = False
+
+        # One clock read serves discovery and every "ago"/header computation
+        now = datetime.now(timezone.utc)
 
-        if self.viewing_detail and self.jobs and self.selected_index < len(self.jobs):
-            return self._render_detail_view(self.jobs[self.selected_index])
+        # Without a discovery thread, discover inline
+        if self._discovery_thread is None:
+            self.refresh_jobs(now)
+
+        snapshot = self._snapshot
+        jobs = snapshot.jobs
+        if self.viewing_detail and jobs and self.selected_index < len(jobs):
+            return self._render_detail_view(jobs[self.selected_index], now)
         else:
-            return self._render_dashboard_view()
+            return self._render_dashboard_view(snapshot, now)
 
-    def _render_dashboard_view(self) -> Layout:
+    def _render_dashboard_view(self, snapshot: _JobsSnapshot, now: datetime) -> Layout:
         """Render main dashboard view."""
         layout = Layout()
 
         # Header
-        now = datetime.now().strftime("%H:%M:%S")
+        updated = now.astimezone().strftime("%H:%M:%S")
         header = Panel(
-            Text(f"PDF Transcription Monitor                  Updated: {now}", justify="left"),
+            Text(f"PDF Transcription Monitor                  Updated: {updated}", justify="left"),
             style="bold #5f8787"  # Muted teal
         )
 
         # Active jobs
-        active_jobs = [j for j in self.jobs if j.is_active]
-        recent_jobs = [j for j in self.jobs if not j.is_active][:self.recent_limit]
+        active_jobs = snapshot.active
+        recent_jobs = snapshot.recent
 
         if not active_jobs and not recent_jobs:
             # Empty state
             content = self._render_empty_state()
         else:
             # Active jobs section
-            active_section = self._render_active_jobs(active_jobs)
+            active_section = self._render_active_jobs(active_jobs, now)
 
             # Recent jobs section
-            recent_section = self._render_recent_jobs(recent_jobs)
+            recent_section = self._render_recent_jobs(recent_jobs, now)
 
             # Combine sections
             content = Table.grid(padding=(0, 0))
@@ -118,7 +260,7 @@ class DashboardView:
 
         return layout
 
-    def _render_active_jobs(self, jobs: list[JobInfo]) -> Table:
+    def _render_active_jobs(self, jobs: list[JobInfo], now: datetime) -> Table:
         """Render active jobs section."""
         table = Table.grid(padding=(0, 0))  # Remove horizontal padding
         table.add_column(style="bold")
@@ -134,25 +276,20 @@ class DashboardView:
             is_selected = i == self.selected_index and not self.viewing_detail
             prefix = "> " if is_selected else "  "
 
-            # Job name with stalled indicator
-            job_name = Text(prefix + job.job_id)
+            # One multi-line Text per job: name, bar, pages, stats
+            block = Text(prefix + job.job_id)
             if job.is_stalled:
-                job_name.append(" [STALLED]", style="bold #5f8787")  # Muted teal warning
-
-            table.add_row(job_name)
+                block.append(" [STALLED]", style="bold #5f8787")  # Muted teal warning
 
             # Progress bar
-            metrics = calculate_metrics(job.event_log_path)
+            metrics = calculate_metrics(job.event_log_path, now=now)
             if metrics:
-                progress_bar = self._create_progress_bar(
+                block.append("\n  ")
+                block.append_text(self._create_progress_bar(
                     metrics.current_page,
                     metrics.total_pages,
                     metrics.progress_percent
-                )
-                # Add as Text object with indent
-                row = Text("  ")
-                row.append_text(progress_bar)
-                table.add_row(row)
+                ))
 
                 # Stats line
                 error_text = f"{metrics.current_page}/{metrics.total_pages} pages"
@@ -170,24 +307,23 @@ class DashboardView:
                     stats_parts.append("0 errors")
 
                 stats = " | ".join(stats_parts)  # Use regular pipe instead of box-drawing character
-                table.add_row(f"  {error_text}")
-                table.add_row(f"  {stats}")
+                block.append(f"\n  {error_text}\n  {stats}")
 
                 # Last heartbeat for stalled jobs
                 if job.is_stalled and job.last_heartbeat:
-                    now = datetime.now(timezone.utc)
                     seconds_ago = (now - job.last_heartbeat).total_seconds()
                     minutes_ago = int(seconds_ago / 60)
-                    table.add_row(
-                        Text(f"  Last heartbeat: {minutes_ago}m {int(seconds_ago % 60)}s ago",
-                             style="dim #888888")  # Dim gray
+                    block.append(
+                        f"\n  Last heartbeat: {minutes_ago}m {int(seconds_ago % 60)}s ago",
+                        style="dim #888888"  # Dim gray
                     )
 
+            table.add_row(block)
             table.add_row("")  # Spacer between jobs
 
         return table
 
-    def _render_recent_jobs(self, jobs: list[JobInfo]) -> Table:
+    def _render_recent_jobs(self, jobs: list[JobInfo], now: datetime) -> Table:
         """Render recent completed jobs section."""
         table = Table.grid(padding=(0, 0))  # Remove horizontal padding
         table.add_column()
@@ -198,22 +334,14 @@ class DashboardView:
         table.add_row(Text(f"Recent (last {self.recent_limit} completed)", style="bold #5f8787"))  # Muted teal
         table.add_row("")  # Spacer
 
+        # All recent lines go into one Text rather than a row each
+        block = Text(style="dim #99bbaa")  # Dim desaturated teal
         for job in jobs[:5]:  # Show top 5 recent
             # Calculate time since completion
             time_ago = "unknown"
             if job.completed_at:
-                now = datetime.now(timezone.utc)
-                delta = now - job.completed_at
-                hours = delta.total_seconds() / 3600
-
-                if hours < 1:
-                    minutes = int(delta.total_seconds() / 60)
-                    time_ago = f"{minutes}m ago"
-                elif hours < 24:
-                    time_ago = f"{int(hours)}h ago"
-                else:
-                    days = int(hours / 24)
-                    time_ago = f"{days}d ago"
+                minutes = int((now - job.completed_at).total_seconds() / 60)
+                time_ago = _format_time_ago(minutes)
 
             # Format line
             error_info = ""
@@ -224,9 +352,11 @@ class DashboardView:
 
             pages_info = f"{job.total_pages or 0} pages" if job.total_pages else "unknown pages"
 
-            line = f"  ✓ {job.job_id} (completed {time_ago}, {pages_info}{error_info})"
-            table.add_row(Text(line, style="dim #99bbaa"))  # Dim desaturated teal
+            if block:
+                block.append("\n")
+            block.append(f"  ✓ {job.job_id} (completed {time_ago}, {pages_info}{error_info})")
 
+        table.add_row(block)
         return table
 
     def _render_empty_state(self) -> Table:
@@ -246,15 +376,15 @@ class DashboardView:
 
         return table
 
-    def _render_detail_view(self, job: JobInfo) -> Layout:
+    def _render_detail_view(self, job: JobInfo, now: datetime) -> Layout:
         """Render detail view for a specific job."""
         layout = Layout()
 
         # Header
-        now = datetime.now().strftime("%H:%M:%S")
+        updated = now.astimezone().strftime("%H:%M:%S")
         status = "[STALLED]" if job.is_stalled else ("[ACTIVE]" if job.is_active else "[COMPLETED]")
         header = Panel(
-            Text(f"{job.job_id} {status}                  Updated: {now}", justify="left"),
+            Text(f"{job.job_id} {status}                  Updated: {updated}", justify="left"),
             style="bold #5f8787"  # Muted teal
         )
 
@@ -263,7 +393,7 @@ class DashboardView:
         content.add_column()
 
         # Progress section
-        metrics = calculate_metrics(job.event_log_path)
+        metrics = calculate_metrics(job.event_log_path, now=now)
         if metrics:
             content.add_row(Text("Progress", style="bold"))
             progress_bar = self._create_progress_bar(
@@ -276,10 +406,12 @@ class DashboardView:
 
             # Metrics section
             content.add_row(Text("Metrics", style="bold"))
-            content.add_row(f"  Velocity (50-page window): {metrics.velocity_pages_per_hour:.1f} pages/hour")
-            content.add_row(f"  ETA: {format_eta(metrics.eta_hours)} (completion around {format_completion_time(metrics.completion_time)})")
-            content.add_row(f"  Elapsed: {format_elapsed_time(metrics.elapsed_time)}")
-            content.add_row(f"  CPU: {metrics.cpu_percent:.1f}% │ Memory: {metrics.memory_mb/1024:.1f} GB")
+            content.add_row(Text("\n".join([
+                f"  Velocity (50-page window): {metrics.velocity_pages_per_hour:.1f} pages/hour",
+                f"  ETA: {format_eta(metrics.eta_hours)} (completion around {format_completion_time(metrics.completion_time)})",
+                f"  Elapsed: {format_elapsed_time(metrics.elapsed_time)}",
+                f"  CPU: {metrics.cpu_percent:.1f}% │ Memory: {metrics.memory_mb/1024:.1f} GB",
+            ])))
             content.add_row("")
 
         # Metadata section
@@ -293,21 +425,34 @@ class DashboardView:
             content.add_row(f"  Quality: {job.quality} │ Mode: {job.mode}")
             content.add_row("")
 
+        # One backward pass over the log collects the last 10 events and the
+        # last 5 errors anywhere in it, stopping as soon as both are satisfied
+        recent_events: list[Event] = []
+        error_events: list[ErrorEvent] = []
+        for event in iter_event_log_typed_reversed(job.event_log_path):
+            if len(recent_events) < 10:
+                recent_events.append(event)
+            if isinstance(event, ErrorEvent) and len(error_events) < 5:
+                error_events.append(event)
+            if len(recent_events) == 10 and len(error_events) == 5:
+                break
+
         # Errors section
         content.add_row(Text(f"Errors ({job.error_count})", style="bold"))
         if job.error_count > 0 or job.warning_count > 0:
-            # Read error events from log
-            all_events = read_event_log_typed(job.event_log_path)
-            error_events = [e for e in all_events if isinstance(e, ErrorEvent)][-5:]  # Last 5
-
             if error_events:
-                for err in error_events:
+                # One Text for all error lines, one styled span per line
+                errors_block = Text()
+                for err in reversed(error_events):  # Oldest of the last 5 first
+                    if errors_block:
+                        errors_block.append("\n")
                     style = "#5f8787" if err.severity == "error" else "#99bbaa"
                     page_info = f"page {err.page_number}" if err.page_number else "general"
-                    content.add_row(Text(
+                    errors_block.append(
                         f"  [{err.severity}] {err.error_type} ({page_info}): {err.error_message}",
                         style=style
-                    ))
+                    )
+                content.add_row(errors_block)
             else:
                 content.add_row(Text(f"  {job.warning_count} warnings", style="#99bbaa"))
         else:
@@ -316,23 +461,16 @@ class DashboardView:
 
         # Recent events section
         content.add_row(Text("Recent Events", style="bold"))
-        all_events = read_event_log_typed(job.event_log_path)
-        recent_events = all_events[-10:]  # Last 10 events
-
-        for event in reversed(recent_events):  # Most recent first
+        event_lines = []
+        for event in recent_events:  # Most recent first
+            formatter = _EVENT_ROW_FORMATTERS.get(type(event))
+            if formatter is None:
+                continue
             timestamp = event.timestamp
             time_str = timestamp.split("T")[1][:8] if "T" in timestamp else timestamp
-
-            if isinstance(event, PageCompletedEvent):
-                duration = event.duration_ms / 1000
-                content.add_row(f"  {time_str} │ page_completed │ page {event.page_number}, {duration:.1f}s")
-
-            elif isinstance(event, HeartbeatEvent):
-                pages_since = event.pages_completed_since_last_heartbeat
-                content.add_row(f"  {time_str} │ heartbeat      │ page {event.current_page}, velocity {pages_since} pg/30s")
-
-            elif isinstance(event, (JobStartedEvent, JobCompletedEvent)):
-                content.add_row(f"  {time_str} │ {event.event_type:14} │")
+            event_lines.append(f"  {time_str} │ {formatter(event)}")
+        if event_lines:
+            content.add_row(Text("\n".join(event_lines)))
 
         # Footer
         footer = Panel(
@@ -351,21 +489,17 @@ class DashboardView:
 
     def _create_progress_bar(self, current: int, total: int, percent: float) -> Text:
         """Create a text-based progress bar as a Text object (don't render to string)."""
-        # Build progress bar manually using Rich styling
-        bar_width = 30
-        filled = int(bar_width * percent / 100)
-        empty = bar_width - filled
-
-        # Build as a single Text object
-        result = Text()
-        result.append(f"{percent:>4.1f}%", style="#5f8787")
-        result.append(" ")
-        result.append("━" * filled, style="#5f8787")
-        result.append("━" * empty, style="dim")
-        result.append(" ")
-        result.append(f"({current}/{total} pages)")
-
-        return result
+        filled = int(PROGRESS_BAR_WIDTH * percent / 100)
+
+        # Build as a single Text object in one pass
+        return Text.assemble(
+            (f"{percent:>4.1f}%", "#5f8787"),
+            " ",
+            (_PROGRESS_BAR[:filled], "#5f8787"),
+            (_PROGRESS_BAR[filled:], "dim"),
+            " ",
+            f"({current}/{total} pages)",
+        )
 
     def handle_key(self, key: str) -> bool:
         """
@@ -380,26 +514,28 @@ class DashboardView:
         if key in ("q", "Q"):
             return False
 
-        elif key in ("r", "R"):
-            # Force refresh (will happen on next render)
-            pass
+        # Navigation and refresh keys all need a redraw
+        self.dirty = True
+
+        if key in ("r", "R"):
+            # Force refresh (rediscover now when discovery runs in background)
+            self.request_rediscovery()
 
         elif key in ("j", "J", "down"):
             if not self.viewing_detail:
-                active_count = len([j for j in self.jobs if j.is_active])
+                active_count = len(self._snapshot.active)
                 if active_count > 0:
                     self.selected_index = (self.selected_index + 1) % active_count
 
         elif key in ("k", "K", "up"):
             if not self.viewing_detail:
-                active_count = len([j for j in self.jobs if j.is_active])
+                active_count = len(self._snapshot.active)
                 if active_count > 0:
                     self.selected_index = (self.selected_index - 1) % active_count
 
         elif key == "enter":
             if not self.viewing_detail and self.jobs:
-                active_jobs = [j for j in self.jobs if j.is_active]
-                if self.selected_index < len(active_jobs):
+                if self.selected_index < len(self._snapshot.active):
                     self.viewing_detail = True
 
         elif key == "escape":
@@ -409,6 +545,42 @@ class DashboardView:
         return True
 
 
+@lru_cache(maxsize=512)
+def _format_time_ago(minutes: int) -> str:
+    """Format whole minutes since an event as "Nm/Nh/Nd ago"."""
+    if minutes < 60:
+        return f"{minutes}m ago"
+    elif minutes < 24 * 60:
+        return f"{minutes // 60}h ago"
+    else:
+        return f"{minutes // (24 * 60)}d ago"
+
+
+def _supports_synchronized_output() -> bool:
+    """Whether the terminal is known to honor synchronized output (mode 2026)."""
+    term_program = os.environ.get("TERM_PROGRAM", "").lower()
+    term = os.environ.get("TERM", "").lower()
+    return (
+        term_program in _SYNC_OUTPUT_TERM_PROGRAMS
+        or any(name in term for name in _SYNC_OUTPUT_TERMS)
+    )
+
+
+@contextmanager
+def _synchronized_output(console: Console, enabled: bool) -> Iterator[None]:
+    """Bracket the writes in the block as one atomic terminal frame."""
+    if not enabled:
+        yield
+        return
+
+    console.file.write(BEGIN_SYNCHRONIZED_UPDATE)
+    try:
+        yield
+    finally:
+        console.file.write(END_SYNCHRONIZED_UPDATE)
+        console.file.flush()
+
+
 def run_dashboard(
     output_dir: Path | None = None,
     refresh_interval: int = 5,
@@ -440,9 +612,10 @@ def run_dashboard(
 
     # Run live display with keyboard handling
     try:
+        # No auto-refresh timer: the loop below redraws exactly once per change
         with Live(
             dashboard.render(),
-            refresh_per_second=1.0 / refresh_interval,
+            auto_refresh=False,
             console=dashboard.console,
             screen=True
         ) as live:
@@ -455,13 +628,21 @@ def run_dashboard(
             try:
                 tty.setcbreak(sys.stdin.fileno())
 
+                # Discovery runs in the background from here on; this loop
+                # only handles keys and redraws when something changed
+                dashboard.start_discovery()
+                sync_output = _supports_synchronized_output()
+
                 while True:
                     # Update display
-                    live.update(dashboard.render())
+                    if dashboard.dirty:
+                        layout = dashboard.render()
+                        with _synchronized_output(dashboard.console, sync_output):
+                            live.update(layout, refresh=True)
 
                     # Check for key input (non-blocking)
                     import select
-                    if select.select([sys.stdin], [], [], refresh_interval)[0]:
+                    if select.select([sys.stdin], [], [], KEY_POLL_SECONDS)[0]:
                         key = sys.stdin.read(1)
 
                         # Handle special keys
@@ -481,6 +662,8 @@ def run_dashboard(
                             break
 
             finally:
+                dashboard.stop_discovery()
+
                 # Restore terminal settings
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
 
@@ -1,20 +1,24 @@
 """Auto-discovery of transcription jobs from event logs."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
+from typing import Any, Callable, Iterable
+import heapq
 import logging
+import os
+import stat
+import sys
 
-from pdf_transcriber.events import read_event_log_typed
-from pdf_transcriber.event_types import (
-    JobStartedEvent,
-    PageCompletedEvent,
-    HeartbeatEvent,
-    ErrorEvent,
-    JobCompletedEvent,
+from pdf_transcriber.events import (
+    iter_event_log_reversed,
+    read_event_log_from,
 )
 
 logger = logging.getLogger(__name__)
 
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 
 @dataclass
 class JobInfo:
@@ -49,10 +53,24 @@ class JobInfo:
     cpu_percent: float = 0.0
     memory_mb: int = 0
 
+    # Listing order key, computed once per discovery (see _sort_key())
+    sort_key: tuple = field(default=(), repr=False, compare=False)
+
+
+# Resolved event log path -> (st_mtime_ns, st_size, bytes consumed, JobInfo
+# folded from those bytes). Finished jobs never touch their log again, so
+# refreshes skip them; growing logs only have their new tail parsed.
+_JOB_CACHE: dict[Path, tuple[int, int, int, JobInfo]] = {}
+
+# events.jsonl symlink path -> ((st_ino, st_mtime_ns) of the link, resolved target)
+_SYMLINK_CACHE: dict[str, tuple[tuple[int, int], Path]] = {}
+
 
 def discover_jobs(
     output_dir: Path,
-    stale_threshold_seconds: int = 120
+    stale_threshold_seconds: int = 120,
+    recent_limit: int | None = None,
+    now: datetime | None = None
 ) -> list[JobInfo]:
     """
     Discover all transcription jobs by scanning output directories.
@@ -63,51 +81,143 @@ def discover_jobs(
     Args:
         output_dir: Root output directory to scan
         stale_threshold_seconds: Seconds without heartbeat before job is stalled
+        recent_limit: Keep only this many most recent finished jobs (default: all)
+        now: Current UTC time for stall checks (default: read the clock once)
 
     Returns:
         List of discovered jobs (active first, then recent completed)
     """
-    jobs = []
+    jobs: list[JobInfo] = []
+    if now is None:
+        now = datetime.now(timezone.utc)
 
-    if not output_dir.exists():
-        logger.debug(f"Output directory not found: {output_dir}")
+    # Scan for directories with events.jsonl. DirEntry.is_dir() is answered
+    # from the directory listing, and one stat of the log both checks that it
+    # exists (following the symlink) and feeds the parse cache key.
+    try:
+        it = os.scandir(output_dir)
+    except FileNotFoundError:
+        logger.debug("Output directory not found: %s", output_dir)
         return jobs
 
-    # Scan for directories with events.jsonl
-    for job_dir in output_dir.iterdir():
-        if not job_dir.is_dir():
-            continue
-
-        event_log = job_dir / "events.jsonl"
-        if not event_log.exists() and not event_log.is_symlink():
-            continue
+    candidates = []
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+
+            event_log_str = os.path.join(entry.path, "events.jsonl")
+            try:
+                st = os.stat(event_log_str)
+            except OSError:
+                continue
+            candidates.append((st.st_mtime_ns, entry, event_log_str, st))
+
+    # With a recent_limit, parse newest logs first. Once enough finished jobs
+    # are in hand, a log older than all of them and untouched for longer than
+    # the stale threshold can't be listed as recent, and if its job never
+    # finished it is long dead, so the history behind it is never opened.
+    if recent_limit:
+        candidates.sort(key=itemgetter(0), reverse=True)
+        stale_horizon_ns = int((now.timestamp() - stale_threshold_seconds) * 1e9)
+    finished_count = 0
+
+    for mtime_ns, entry, event_log_str, st in candidates:
+        if (
+            recent_limit
+            and finished_count >= recent_limit
+            and mtime_ns < stale_horizon_ns
+        ):
+            break
 
         # Parse event log
+        job_dir = Path(entry.path)
         try:
             job_info = _parse_job_from_events(
                 job_dir,
-                event_log,
-                stale_threshold_seconds
+                Path(event_log_str),
+                stale_threshold_seconds,
+                st,
+                now
             )
             if job_info:
                 jobs.append(job_info)
+                if not job_info.is_active:
+                    finished_count += 1
         except Exception as e:
-            logger.warning(f"Failed to parse events for {job_dir.name}: {e}")
+            logger.warning(f"Failed to parse events for {entry.name}: {e}")
 
     # Sort: active first (by current_page desc), then completed (by completion time desc)
-    jobs.sort(key=lambda j: (
-        not j.is_active,  # Active jobs first
-        -(j.current_page or 0) if j.is_active else 0,  # Active: sort by progress
-        -(j.completed_at.timestamp() if j.completed_at else 0)  # Completed: sort by time
-    ))
-
+    active = [j for j in jobs if j.is_active]
+    finished = [j for j in jobs if not j.is_active]
+    active.sort(key=_by_sort_key)
+    if recent_limit is not None and recent_limit < len(finished):
+        # Only the newest recent_limit finished jobs need ordering
+        finished = heapq.nsmallest(recent_limit, finished, key=_by_sort_key)
+    else:
+        finished.sort(key=_by_sort_key)
+    jobs = active + finished
+
+    _prune_caches(event_log_str for _, _, event_log_str, _ in candidates)
     return jobs
 
 
+def _prune_caches(event_log_strs: Iterable[str]) -> None:
+    """
+    Drop cache entries for event logs that are gone from the output dir.
+
+    Logs still present but skipped by the recent_limit horizon are kept,
+    so they stay cheap if a later call asks for more history.
+    """
+    seen_links = set(event_log_strs)
+    seen_logs = set()
+    for key in seen_links:
+        cached = _SYMLINK_CACHE.get(key)
+        seen_logs.add(cached[1] if cached is not None else Path(key))
+
+    for key in _SYMLINK_CACHE.keys() - seen_links:
+        del _SYMLINK_CACHE[key]
+    for path in _JOB_CACHE.keys() - seen_logs:
+        del _JOB_CACHE[path]
+
+
+def event_log_fingerprint(output_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """
+    Cheap change detector for discover_jobs().
+
+    Stats each job's events.jsonl without parsing it, so callers can skip
+    a rediscovery when nothing has been written.
+
+    Args:
+        output_dir: Root output directory to scan
+
+    Returns:
+        Sorted (job dir name, st_mtime_ns, st_size) tuples, one per event log
+    """
+    entries = []
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                try:
+                    st = os.stat(os.path.join(entry.path, "events.jsonl"))
+                except OSError:
+                    continue
+                entries.append((entry.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        return ()
+
+    entries.sort()
+    return tuple(entries)
+
+
 def _parse_job_from_events(
     job_dir: Path,
     event_log_path: Path,
-    stale_threshold_seconds: int
+    stale_threshold_seconds: int,
+    st: os.stat_result | None = None,
+    now: datetime | None = None
 ) -> JobInfo | None:
     """
     Parse event log to extract job information.
@@ -116,60 +226,34 @@ def _parse_job_from_events(
         job_dir: Output directory for this job
         event_log_path: Path to events.jsonl (may be symlink)
         stale_threshold_seconds: Threshold for stale detection
+        st: Stat of the log's target if the caller already has one
+        now: Current UTC time for the stall check (default: read the clock)
 
     Returns:
         JobInfo if events found, None otherwise
     """
     # Follow symlink if needed
-    if event_log_path.is_symlink():
-        event_log_path = event_log_path.resolve()
-
-    # Read events as typed dataclasses
-    events = read_event_log_typed(event_log_path)
-    if not events:
-        return None
+    event_log_path = _resolve_event_log(event_log_path)
 
-    # Initialize job info
-    job_info = JobInfo(
-        job_id=job_dir.name,
-        output_dir=job_dir,
-        event_log_path=event_log_path,
-        is_active=False,
-        is_stalled=False
-    )
-
-    # Process events in order using isinstance dispatch
-    for event in events:
-        if isinstance(event, JobStartedEvent):
-            job_info.pdf_path = event.pdf_path
-            job_info.total_pages = event.total_pages
-            job_info.quality = event.quality
-            job_info.mode = event.mode
-            job_info.metadata = event.metadata
-            job_info.started_at = _parse_timestamp(event.timestamp)
-
-        elif isinstance(event, PageCompletedEvent):
-            job_info.pages_completed += 1
-            if event.page_number > job_info.current_page:
-                job_info.current_page = event.page_number
-
-        elif isinstance(event, HeartbeatEvent):
-            job_info.last_heartbeat = _parse_timestamp(event.timestamp)
-            job_info.current_page = event.current_page
-            job_info.cpu_percent = event.cpu_percent
-            job_info.memory_mb = event.memory_mb
-
-        elif isinstance(event, ErrorEvent):
-            if event.severity == "error":
-                job_info.error_count += 1
-            else:
-                job_info.warning_count += 1
-
-        elif isinstance(event, JobCompletedEvent):
-            job_info.completed_at = _parse_timestamp(event.timestamp)
-            job_info.is_active = False
-            job_info.error_count = event.error_count
-            job_info.warning_count = event.warning_count
+    if st is None:
+        try:
+            st = os.stat(event_log_path)
+        except FileNotFoundError:
+            return None
+
+    cached = _JOB_CACHE.get(event_log_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        folded = cached[3]
+    else:
+        parsed = _fold_event_log(job_dir, event_log_path, st, cached)
+        if parsed is None:
+            _JOB_CACHE.pop(event_log_path, None)
+            return None
+        offset, folded = parsed
+        _JOB_CACHE[event_log_path] = (st.st_mtime_ns, st.st_size, offset, folded)
+
+    # Activity and stall status depend on the clock, so derive them per call
+    job_info = replace(folded)
 
     # Determine if job is active or stalled
     if job_info.completed_at is None:
@@ -182,30 +266,246 @@ def _parse_job_from_events(
             job_info.completed_at = datetime.fromtimestamp(mtime, tz=timezone.utc)
             job_info.is_active = False
             logger.debug(
-                f"Inferred completion for {job_dir.name} from output file mtime"
+                "Inferred completion for %s from output file mtime", job_dir.name
             )
         else:
             job_info.is_active = True
 
             # Check for stalled job (no heartbeat in threshold period)
             if job_info.last_heartbeat:
-                now = datetime.now(timezone.utc)
+                if now is None:
+                    now = datetime.now(timezone.utc)
                 seconds_since_heartbeat = (now - job_info.last_heartbeat).total_seconds()
                 if seconds_since_heartbeat > stale_threshold_seconds:
                     job_info.is_stalled = True
 
+    job_info.sort_key = _sort_key(job_info)
     return job_info
 
 
+def _fold_event_log(
+    job_dir: Path,
+    event_log_path: Path,
+    st: os.stat_result,
+    cached: tuple[int, int, int, JobInfo] | None
+) -> tuple[int, JobInfo] | None:
+    """
+    Fold a changed event log into JobInfo, reusing the cached prefix if any.
+
+    Args:
+        job_dir: Output directory for this job
+        event_log_path: Resolved path to the event log
+        st: Stat of the log taken before reading
+        cached: Previous _JOB_CACHE entry for this log, if any
+
+    Returns:
+        (bytes consumed, JobInfo), or None if the log has no events
+    """
+    offset, folded = 0, None
+    if cached is not None and st.st_size >= cached[2]:
+        # Log only grew: fold in the appended events
+        offset, folded = cached[2], cached[3]
+    else:
+        # First read, or the log was truncated/rotated: start over.
+        # A finished job only needs its last events.
+        folded = _parse_finished_job(job_dir, event_log_path)
+        if folded is not None:
+            # The shortcut covers exactly st_size bytes only if nothing
+            # was appended while it read; otherwise fold from scratch
+            try:
+                after = os.stat(event_log_path)
+            except OSError:
+                after = None
+            if after is not None and (after.st_mtime_ns, after.st_size) == (
+                st.st_mtime_ns, st.st_size
+            ):
+                return st.st_size, folded
+            folded = None
+
+    events, offset = read_event_log_from(event_log_path, offset)
+    if folded is None:
+        if not events:
+            return None
+        folded = JobInfo(
+            job_id=job_dir.name,
+            output_dir=job_dir,
+            event_log_path=event_log_path,
+            is_active=False,
+            is_stalled=False
+        )
+    _apply_events(folded, events)
+    return offset, folded
+
+
+def _resolve_event_log(event_log_path: Path) -> Path:
+    """
+    Follow an events.jsonl symlink, remembering the target between refreshes.
+
+    One lstat() decides whether the cached target still applies; resolve()
+    (an lstat/readlink per path component) only runs when the link is new
+    or was recreated.
+    """
+    key = str(event_log_path)
+    try:
+        lst = os.lstat(key)
+    except OSError:
+        return event_log_path
+    if not stat.S_ISLNK(lst.st_mode):
+        return event_log_path
+
+    link_id = (lst.st_ino, lst.st_mtime_ns)
+    cached = _SYMLINK_CACHE.get(key)
+    if cached is not None and cached[0] == link_id:
+        return cached[1]
+
+    resolved = event_log_path.resolve()
+    _SYMLINK_CACHE[key] = (link_id, resolved)
+    return resolved
+
+
+def _parse_finished_job(job_dir: Path, event_log_path: Path) -> JobInfo | None:
+    """
+    Build JobInfo for a finished job from its last events only.
+
+    A log that ends with job_completed has all the summary fields discovery
+    shows: job_completed carries the final page, error and warning counts,
+    and the newest job_started describes that run (re-runs with
+    resume=False append a fresh job_started to the same log, and the full
+    fold lets the last one win too). Lines between them are only
+    substring-checked, never decoded, so current_page and the heartbeat
+    resource fields keep their defaults.
+
+    Returns:
+        JobInfo, or None if the log doesn't have that shape (in-progress or
+        malformed) and needs a full parse
+    """
+    last = next(iter_event_log_reversed(event_log_path), None)
+    if last is None or last.get("event_type") != "job_completed":
+        return None
+    pages_completed = last.get("pages_completed")
+    if pages_completed is None:
+        return None
+
+    started = None
+    for event in iter_event_log_reversed(event_log_path, contains=b"job_started"):
+        if event.get("event_type") == "job_started":
+            started = event
+            break
+    if started is None:
+        return None
+
+    job_info = JobInfo(
+        job_id=job_dir.name,
+        output_dir=job_dir,
+        event_log_path=event_log_path,
+        is_active=False,
+        is_stalled=False
+    )
+    _apply_events(job_info, [started, last])
+    job_info.pages_completed = pages_completed
+    return job_info
+
+
+def _sort_key(job_info: JobInfo) -> tuple:
+    """Active jobs first by progress desc, then finished by completion time desc."""
+    if job_info.is_active:
+        return (False, -(job_info.current_page or 0), 0)
+    completed_ts = job_info.completed_at.timestamp() if job_info.completed_at else 0
+    return (True, 0, -completed_ts)
+
+
+def _by_sort_key(job_info: JobInfo) -> tuple:
+    return job_info.sort_key
+
+
+# Event handlers read the raw dicts straight from the log: discovery only
+# keeps counters and a few fields, so building typed events first would
+# cost more than the JSON decode itself. Required keys are read before any
+# field is assigned, so an event missing one (KeyError) changes nothing.
+
+def _on_job_started(job_info: JobInfo, event: dict[str, Any]) -> None:
+    started_at = _parse_timestamp(event["timestamp"])
+    pdf_path = event["pdf_path"]
+    total_pages = event["total_pages"]
+    quality = event["quality"]
+    mode = event["mode"]
+    job_info.pdf_path = pdf_path
+    job_info.total_pages = total_pages
+    job_info.quality = quality
+    job_info.mode = mode
+    job_info.metadata = event.get("metadata", {})
+    job_info.started_at = started_at
+
+
+def _on_page_completed(job_info: JobInfo, event: dict[str, Any]) -> None:
+    page_number = event["page_number"]
+    job_info.pages_completed += 1
+    if page_number > job_info.current_page:
+        job_info.current_page = page_number
+
+
+def _on_heartbeat(job_info: JobInfo, event: dict[str, Any]) -> None:
+    last_heartbeat = _parse_timestamp(event["timestamp"])
+    job_info.current_page = event["current_page"]
+    job_info.last_heartbeat = last_heartbeat
+    job_info.cpu_percent = event.get("cpu_percent", 0.0)
+    job_info.memory_mb = event.get("memory_mb", 0)
+
+
+def _on_error(job_info: JobInfo, event: dict[str, Any]) -> None:
+    if event["severity"] == "error":
+        job_info.error_count += 1
+    else:
+        job_info.warning_count += 1
+
+
+def _on_job_completed(job_info: JobInfo, event: dict[str, Any]) -> None:
+    completed_at = _parse_timestamp(event["timestamp"])
+    job_info.completed_at = completed_at
+    job_info.is_active = False
+    job_info.error_count = event.get("error_count", 0)
+    job_info.warning_count = event.get("warning_count", 0)
+
+
+# event_type -> handler folding that event into a JobInfo
+_HANDLERS: dict[str, Callable[[JobInfo, dict[str, Any]], None]] = {
+    "job_started": _on_job_started,
+    "page_completed": _on_page_completed,
+    "heartbeat": _on_heartbeat,
+    "error": _on_error,
+    "job_completed": _on_job_completed,
+}
+
+
+def _apply_events(job_info: JobInfo, events: list[dict[str, Any]]) -> None:
+    """Fold raw events, in log order, into job_info."""
+    handlers = _HANDLERS
+    for event in events:
+        handler = handlers.get(event.get("event_type", ""))
+        if handler is None:
+            continue
+        try:
+            handler(job_info, event)
+        except KeyError as e:
+            logger.warning(f"Skipping unparseable event: missing {e}")
+
+
 def _parse_timestamp(ts_str: str | None) -> datetime | None:
     """Parse ISO 8601 timestamp string."""
     if not ts_str:
         return None
 
+    # Python 3.11+ parses the trailing 'Z' itself; skip the copy
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        try:
+            return datetime.fromisoformat(ts_str)
+        except ValueError:
+            pass
+
     try:
         # Handle both 'Z' and '+00:00' formats
         ts_str = ts_str.replace('Z', '+00:00')
         return datetime.fromisoformat(ts_str)
     except Exception as e:
-        logger.debug(f"Failed to parse timestamp '{ts_str}': {e}")
+        logger.debug("Failed to parse timestamp %r: %s", ts_str, e)
         return None
@@ -1,18 +1,27 @@
 """Velocity and ETA calculation for transcription jobs."""
+from bisect import insort
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable
 import logging
+import os
+import sys
 
-from pdf_transcriber.events import read_event_log_typed
+from pdf_transcriber.events import iter_event_log_typed_reversed, read_event_log_typed_from
 from pdf_transcriber.event_types import (
     JobStartedEvent,
     PageCompletedEvent,
     HeartbeatEvent,
+    JobCompletedEvent,
 )
 
 logger = logging.getLogger(__name__)
 
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 
 @dataclass
 class JobMetrics:
@@ -25,7 +34,7 @@ class JobMetrics:
 
     # Velocity (rolling window)
     velocity_pages_per_hour: float
-    window_size: int  # Actual pages used for calculation
+    window_size: int  # Actual pages used for calculation (0: whole-run average)
 
     # Time estimates
     elapsed_time: timedelta | None
@@ -37,74 +46,241 @@ class JobMetrics:
     memory_mb: int
 
 
+class RollingVelocity:
+    """
+    Pages-per-hour over the most recent pages, updated one page at a time.
+
+    Keeps only the last window_size completion times, so feeding a job's
+    whole history costs O(1) memory per page and reading the velocity is
+    O(1) regardless of job length.
+    """
+
+    def __init__(self, window_size: int = 50, min_pages: int = 5):
+        """
+        Args:
+            window_size: Number of recent pages to use for velocity
+            min_pages: Minimum pages needed for a stable velocity
+        """
+        self.min_pages = min_pages
+        self.count = 0  # Pages seen in total, not just those in the window
+        self._window: deque[float] = deque(maxlen=window_size)
+
+    def update(self, ts: datetime) -> None:
+        """Record a page completed at ts."""
+        t = ts.timestamp()
+        window = self._window
+        self.count += 1
+        if not window or t >= window[-1]:
+            # Log order is completion order, so this is the only path taken
+            # in practice
+            window.append(t)
+            return
+
+        # Out-of-order page: keep the window the newest pages by time
+        if len(window) == window.maxlen:
+            if t <= window[0]:
+                return
+            window.popleft()
+        insort(window, t)
+
+    def value(self) -> tuple[float, int]:
+        """
+        Returns:
+            Tuple of (velocity_pages_per_hour, actual_window_size)
+        """
+        window = self._window
+        actual_size = len(window)
+        if self.count < self.min_pages or actual_size < self.min_pages:
+            return 0.0, 0
+
+        time_span = window[-1] - window[0]
+        if time_span <= 0:
+            # All pages completed at same time (unlikely but possible)
+            return 0.0, actual_size
+
+        return actual_size / (time_span / 3600.0), actual_size
+
+
+class EventLogTailer:
+    """
+    Folds a growing event log into the inputs calculate_metrics() needs.
+
+    Remembers how far into the log it has read, so each refresh parses only
+    the lines appended since the last one. A log that shrank (rewritten or
+    rotated) is folded again from the start.
+    """
+
+    def __init__(self, log_path: Path, window_size: int = 50, min_pages: int = 5):
+        """
+        Args:
+            log_path: Path to events.jsonl file
+            window_size: Number of recent pages to use for velocity
+            min_pages: Minimum pages needed for a stable velocity
+        """
+        self.log_path = log_path
+        self.window_size = window_size
+        self.min_pages = min_pages
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.total_pages: int | None = None
+        self.started_at: datetime | None = None
+        self.current_page = 0
+        self.cpu_percent = 0.0
+        self.memory_mb = 0
+        self.velocity = RollingVelocity(self.window_size, self.min_pages)
+        # Set while the log's last event is job_completed (a resumed run
+        # appending more events makes the job active again)
+        self.completed: JobCompletedEvent | None = None
+        self._stat_key: tuple[int, int] | None = None
+
+    def refresh(self, st: os.stat_result | None = None) -> None:
+        """
+        Parse whatever was appended to the log since the last refresh.
+
+        Args:
+            st: Stat of the log if the caller already has one
+        """
+        if st is None:
+            st = os.stat(self.log_path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self._stat_key:
+            return
+        if st.st_size < self.offset:
+            self._reset()
+
+        events, self.offset = read_event_log_typed_from(self.log_path, self.offset)
+        # Page completions dominate the log, so they are tested first;
+        # isinstance() also narrows each branch for the type checker
+        for event in events:
+            if isinstance(event, PageCompletedEvent):
+                ts = _parse_timestamp(event.timestamp)
+                if ts and event.page_number is not None:
+                    self.velocity.update(ts)
+
+            elif isinstance(event, HeartbeatEvent):
+                self.current_page = event.current_page
+                self.cpu_percent = event.cpu_percent
+                self.memory_mb = event.memory_mb
+
+            elif isinstance(event, JobStartedEvent):
+                self.total_pages = event.total_pages
+                self.started_at = _parse_timestamp(event.timestamp)
+
+        if events:
+            last = events[-1]
+            self.completed = last if isinstance(last, JobCompletedEvent) else None
+
+        self._stat_key = stat_key
+
+
+# (log path, window_size, min_pages_for_velocity) -> tailer kept across refreshes
+_TAILERS: dict[tuple[str, int, int], EventLogTailer] = {}
+
+# Log path -> ((st_mtime_ns, st_size), metrics) for logs that end in job_completed
+_COMPLETED: dict[str, tuple[tuple[int, int], JobMetrics]] = {}
+
+
+def prune_metrics_cache(keep: Iterable[Path]) -> None:
+    """
+    Forget cached state for event logs not in keep.
+
+    The dashboard calls this after each discovery so logs of deleted or
+    cleaned-up jobs don't stay in memory for the life of the process.
+    Safe to call from the discovery thread while the UI thread reads.
+
+    Args:
+        keep: Event log paths from the latest discovery
+    """
+    keep_strs = {str(path) for path in keep}
+    for key in [k for k in list(_TAILERS) if k[0] not in keep_strs]:
+        _TAILERS.pop(key, None)
+    for path_str in [p for p in list(_COMPLETED) if p not in keep_strs]:
+        _COMPLETED.pop(path_str, None)
+
+
 def calculate_metrics(
     event_log_path: Path,
     window_size: int = 50,
-    min_pages_for_velocity: int = 5
+    min_pages_for_velocity: int = 5,
+    *,
+    now: datetime | None = None
 ) -> JobMetrics | None:
     """
     Calculate job metrics from event log.
 
     Uses a rolling window approach for velocity calculation to balance
-    responsiveness and stability.
+    responsiveness and stability. Each log is followed by an
+    EventLogTailer, so a call parses only the lines appended since the
+    previous one and an unchanged log is not read at all.
+
+    A log whose last event is job_completed (including failed or partial
+    runs) reports that event's final numbers instead, the same whether or
+    not the log was being tailed: progress from pages_completed, the
+    run's average velocity (window_size 0) and its duration, no ETA.
 
     Args:
         event_log_path: Path to events.jsonl file
         window_size: Number of recent pages to use for velocity (default: 50)
         min_pages_for_velocity: Minimum pages needed for stable velocity (default: 5)
+        now: Current UTC time for elapsed time and ETA (default: read the clock).
+            Pass one value to every job rendered in a refresh.
 
     Returns:
         JobMetrics if sufficient data available, None otherwise
     """
-    # Read event log as typed events
-    events = read_event_log_typed(event_log_path)
-    if not events:
+    try:
+        st = os.stat(event_log_path)
+    except OSError:
         return None
 
-    # Extract key information
-    total_pages = None
-    current_page = 0
-    started_at = None
-    cpu_percent = 0.0
-    memory_mb = 0
-
-    # Collect page completion events
-    page_events: list[tuple[datetime, int]] = []
-
-    for event in events:
-        if isinstance(event, JobStartedEvent):
-            total_pages = event.total_pages
-            started_at = _parse_timestamp(event.timestamp)
-
-        elif isinstance(event, PageCompletedEvent):
-            ts = _parse_timestamp(event.timestamp)
-            if ts and event.page_number is not None:
-                page_events.append((ts, event.page_number))
+    path_str = str(event_log_path)
+    stat_key = (st.st_mtime_ns, st.st_size)
+    completed = _COMPLETED.get(path_str)
+    if completed is not None and completed[0] == stat_key:
+        return completed[1]
+
+    key = (path_str, window_size, min_pages_for_velocity)
+    tailer = _TAILERS.get(key)
+    if tailer is None:
+        # A finished job's final numbers are all in its last event; don't
+        # fold the whole log just to recompute them
+        last = next(iter_event_log_typed_reversed(event_log_path), None)
+        if isinstance(last, JobCompletedEvent):
+            metrics = _completed_metrics(last)
+            _COMPLETED[path_str] = (stat_key, metrics)
+            return metrics
+
+        tailer = EventLogTailer(event_log_path, window_size, min_pages_for_velocity)
+        _TAILERS[key] = tailer
+    try:
+        tailer.refresh(st)
+    except OSError as e:
+        logger.debug("Failed to read event log %s: %s", event_log_path, e)
+        return None
 
-        elif isinstance(event, HeartbeatEvent):
-            current_page = event.current_page
-            cpu_percent = event.cpu_percent
-            memory_mb = event.memory_mb
+    if tailer.completed is not None:
+        return _completed_metrics(tailer.completed)
 
-    if total_pages is None or not page_events:
+    if tailer.total_pages is None or not tailer.velocity.count:
         return None
 
+    total_pages = tailer.total_pages
+    current_page = tailer.current_page
+    velocity, actual_window_size = tailer.velocity.value()
+
     # Calculate progress
-    pages_completed = len(page_events)
     progress_percent = (current_page / total_pages * 100) if total_pages > 0 else 0.0
 
-    # Calculate elapsed time
-    elapsed = None
-    if started_at:
+    # One clock read, so elapsed time and ETA agree with each other
+    if now is None:
         now = datetime.now(timezone.utc)
-        elapsed = now - started_at
 
-    # Calculate velocity using rolling window
-    velocity, actual_window_size = _calculate_rolling_velocity(
-        page_events,
-        window_size,
-        min_pages_for_velocity
-    )
+    # Calculate elapsed time
+    elapsed = None
+    if tailer.started_at:
+        elapsed = now - tailer.started_at
 
     # Calculate ETA
     eta_hours = None
@@ -113,67 +289,43 @@ def calculate_metrics(
     if velocity > 0 and total_pages > current_page:
         remaining_pages = total_pages - current_page
         eta_hours = remaining_pages / velocity
-        completion_time = datetime.now(timezone.utc) + timedelta(hours=eta_hours)
+        completion_time = now + timedelta(hours=eta_hours)
 
     return JobMetrics(
         current_page=current_page,
         total_pages=total_pages,
-        pages_completed=pages_completed,
+        pages_completed=tailer.velocity.count,
         progress_percent=round(progress_percent, 1),
         velocity_pages_per_hour=round(velocity, 1),
         window_size=actual_window_size,
         elapsed_time=elapsed,
         eta_hours=eta_hours,
         completion_time=completion_time,
-        cpu_percent=cpu_percent,
-        memory_mb=memory_mb
+        cpu_percent=tailer.cpu_percent,
+        memory_mb=tailer.memory_mb
     )
 
 
-def _calculate_rolling_velocity(
-    page_events: list[tuple[datetime, int]],
-    window_size: int,
-    min_pages: int
-) -> tuple[float, int]:
-    """
-    Calculate velocity using a rolling window of recent pages.
-
-    Args:
-        page_events: List of (timestamp, page_number) tuples
-        window_size: Target number of pages for window
-        min_pages: Minimum pages required for calculation
-
-    Returns:
-        Tuple of (velocity_pages_per_hour, actual_window_size)
-    """
-    if len(page_events) < min_pages:
-        return 0.0, 0
-
-    # Sort by timestamp (should already be sorted from log)
-    page_events = sorted(page_events, key=lambda x: x[0])
-
-    # Take last N pages
-    window = page_events[-window_size:]
-    actual_size = len(window)
-
-    if actual_size < min_pages:
-        return 0.0, 0
-
-    # Calculate time span
-    first_ts = window[0][0]
-    last_ts = window[-1][0]
-    time_span = (last_ts - first_ts).total_seconds()
-
-    if time_span <= 0:
-        # All pages completed at same time (unlikely but possible)
-        return 0.0, actual_size
-
-    # Calculate velocity (pages per hour)
-    pages_in_window = len(window)
-    hours = time_span / 3600.0
-    velocity = pages_in_window / hours
-
-    return velocity, actual_size
+def _completed_metrics(event: JobCompletedEvent) -> JobMetrics:
+    """Final metrics for a finished job, taken from its job_completed event."""
+    total_pages = event.total_pages
+    pages_completed = event.pages_completed
+    # A run that stopped partway (failed pages, crash) still ends in
+    # job_completed, so progress comes from the pages actually done
+    progress_percent = (pages_completed / total_pages * 100) if total_pages > 0 else 0.0
+    return JobMetrics(
+        current_page=pages_completed,
+        total_pages=total_pages,
+        pages_completed=pages_completed,
+        progress_percent=round(progress_percent, 1),
+        velocity_pages_per_hour=round(event.avg_velocity_pages_per_hour, 1),
+        window_size=0,
+        elapsed_time=timedelta(seconds=event.total_duration_seconds),
+        eta_hours=None,
+        completion_time=None,
+        cpu_percent=0.0,
+        memory_mb=0
+    )
 
 
 def format_elapsed_time(td: timedelta | None) -> str:
@@ -181,9 +333,13 @@ def format_elapsed_time(td: timedelta | None) -> str:
     if td is None:
         return "Unknown"
 
-    total_seconds = int(td.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
+    # Only whole minutes are shown, so that is the cache key
+    return _format_elapsed_minutes(int(td.total_seconds()) // 60)
+
+
+@lru_cache(maxsize=1024)
+def _format_elapsed_minutes(total_minutes: int) -> str:
+    hours, minutes = divmod(total_minutes, 60)
 
     if hours > 0:
         return f"{hours}h {minutes}m"
@@ -197,20 +353,30 @@ def format_eta(eta_hours: float | None) -> str:
         return "Unknown"
 
     if eta_hours < 1:
-        minutes = int(eta_hours * 60)
-        return f"~{minutes}m"
+        return _format_eta_minutes(int(eta_hours * 60))
     else:
         return f"~{eta_hours:.1f}h"
 
 
+@lru_cache(maxsize=64)
+def _format_eta_minutes(minutes: int) -> str:
+    return f"~{minutes}m"
+
+
 def format_completion_time(dt: datetime | None) -> str:
     """Format completion time as human-readable string."""
     if dt is None:
         return "Unknown"
 
-    # Convert to local time
-    local_dt = dt.astimezone()
-    return local_dt.strftime("%H:%M")
+    # Only hours and minutes are shown, so key the cache on the epoch minute
+    return _format_local_clock(int(dt.timestamp()) // 60)
+
+
+@lru_cache(maxsize=256)
+def _format_local_clock(epoch_minute: int) -> str:
+    """HH:MM in local time; fromtimestamp() applies the DST offset for that instant."""
+    local_dt = datetime.fromtimestamp(epoch_minute * 60)
+    return f"{local_dt.hour:02d}:{local_dt.minute:02d}"
 
 
 def _parse_timestamp(ts_str: str | None) -> datetime | None:
@@ -218,10 +384,16 @@ def _parse_timestamp(ts_str: str | None) -> datetime | None:
     if not ts_str:
         return None
 
+    # Python 3.11+ parses the trailing 'Z' itself; skip the copy
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        try:
+            return datetime.fromisoformat(ts_str)
+        except ValueError:
+            pass
+
     try:
         # Handle both 'Z' and '+00:00' formats
-        ts_str = ts_str.replace('Z', '+00:00')
-        return datetime.fromisoformat(ts_str)
+        return datetime.fromisoformat(ts_str.replace('Z', '+00:00'))
     except Exception as e:
-        logger.debug(f"Failed to parse timestamp '{ts_str}': {e}")
+        logger.debug("Failed to parse timestamp %r: %s", ts_str, e)
         return None
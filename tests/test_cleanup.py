@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 import tempfile
 
+from pdf_transcriber import events
 from pdf_transcriber.cleanup import (
     cleanup_telemetry,
     check_job_completed,
@@ -71,8 +72,7 @@ def create_event_log(
         })
 
     with open(log_path, 'w') as f:
-        for event in events:
-            f.write(json.dumps(event) + '\n')
+        f.write(''.join(json.dumps(event) + '\n' for event in events))
 
     return log_path
 
@@ -298,3 +298,49 @@ def test_cleanup_nonexistent_directory(tmp_path):
     assert result.total_logs_found == 0
     assert result.logs_deleted == 0
     assert result.logs_kept == 0
+
+
+def test_completion_check_reads_only_log_ends(temp_dirs, monkeypatch):
+    """A finished job's log is not parsed past its first and last events."""
+    central_dir, _ = temp_dirs
+    # A fixed output_dir: the tmp path embeds the test name, and a
+    # "job_completed" substring in it would change which lines get decoded
+    output_dir = "/data/transcriptions/long-job"
+    log_path = create_event_log(central_dir, "long-job", output_dir, include_completion=False)
+
+    # Bury the completion behind many page events
+    with open(log_path, 'a') as f:
+        for page in range(2, 2000):
+            f.write(json.dumps({
+                "timestamp": "2026-02-14T19:02:00.000000Z",
+                "event_type": "page_completed",
+                "job_id": "long-job",
+                "page_number": page,
+                "duration_ms": 1500
+            }) + '\n')
+        f.write(json.dumps({
+            "timestamp": "2026-02-14T19:10:00.000000Z",
+            "event_type": "job_completed",
+            "job_id": "long-job",
+            "total_pages": 2000,
+            "pages_completed": 2000,
+            "pages_failed": 0,
+        }) + '\n')
+
+    decoded = []
+    real_loads = events._json_loads
+
+    def _spy(line):
+        event = real_loads(line)
+        decoded.append(event["event_type"])
+        return event
+
+    monkeypatch.setattr(events, "_json_loads", _spy)
+    assert check_job_completed(log_path) == (True, output_dir)
+    assert decoded == ["job_completed", "job_started"]
+
+    # Without a completion event only the job_started line is decoded
+    decoded.clear()
+    log_path2 = create_event_log(central_dir, "running-job", output_dir, include_completion=False)
+    assert check_job_completed(log_path2) == (False, output_dir)
+    assert decoded == ["job_started"]
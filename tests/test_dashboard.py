@@ -0,0 +1,95 @@
+"""Tests for the dashboard view's discovery snapshot handling."""
+import time
+
+from pdf_transcriber.events import EventEmitter
+from pdf_transcriber.tui.dashboard import DashboardView
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_background_discovery_refreshes_snapshot(tmp_path):
+    """With discovery in the background, render() reads the thread's snapshot."""
+    dashboard = DashboardView(tmp_path, refresh_interval=60)
+    dashboard.render()
+    assert dashboard.jobs == []
+
+    dashboard.start_discovery()
+    try:
+        output_dir = tmp_path / "job"
+        output_dir.mkdir()
+        emitter = EventEmitter(job_id="job", output_dir=output_dir, central_dir=tmp_path / "telemetry")
+        emitter.emit_job_started(
+            pdf_path="/tmp/test.pdf",
+            output_dir=str(output_dir),
+            total_pages=3,
+            quality="fast",
+            mode="streaming",
+            metadata={},
+        )
+
+        # "r" wakes the thread instead of waiting out refresh_interval
+        assert dashboard.handle_key("r")
+        assert _wait_for(lambda: [j.job_id for j in dashboard.jobs] == ["job"])
+        assert dashboard.render() is not None
+        assert [j.job_id for j in dashboard.jobs] == ["job"]
+    finally:
+        dashboard.stop_discovery()
+
+
+def test_format_time_ago_boundaries():
+    from pdf_transcriber.tui.dashboard import _format_time_ago
+
+    assert _format_time_ago(0) == "0m ago"
+    assert _format_time_ago(59) == "59m ago"
+    assert _format_time_ago(60) == "1h ago"
+    assert _format_time_ago(24 * 60 - 1) == "23h ago"
+    assert _format_time_ago(24 * 60) == "1d ago"
+    assert _format_time_ago(10 * 24 * 60 + 5) == "10d ago"
+
+
+def test_detail_view_lists_errors_from_earlier_runs(tmp_path):
+    """The errors list covers the whole log, not just the newest run."""
+    from datetime import datetime, timezone
+
+    from rich.console import Console
+
+    from pdf_transcriber.tui.discovery import discover_jobs
+
+    output_dir = tmp_path / "job"
+    output_dir.mkdir()
+    for run, message in enumerate(["first run broke", "second run wobbled"]):
+        # Each run has its own emitter, so job_completed counts only its errors
+        emitter = EventEmitter(job_id="job", output_dir=output_dir, central_dir=tmp_path / "telemetry")
+        emitter.emit_job_started(
+            pdf_path="/tmp/test.pdf",
+            output_dir=str(output_dir),
+            total_pages=20,
+            quality="fast",
+            mode="streaming",
+            metadata={},
+        )
+        emitter.emit_error(
+            severity="error" if run == 0 else "warning",
+            error_type="ocr_failure",
+            error_message=message,
+        )
+        for page in range(1, 16):
+            emitter.emit_page_completed(page_number=page, duration_ms=500)
+        emitter.emit_job_completed(total_pages=20, pages_completed=15, pages_failed=0)
+        emitter.stop_heartbeat()
+
+    job = discover_jobs(tmp_path)[0]
+    assert (job.error_count, job.warning_count) == (0, 1)
+    dashboard = DashboardView(tmp_path, refresh_interval=60)
+    console = Console(record=True, width=200, height=80)
+    console.print(dashboard._render_detail_view(job, datetime.now(timezone.utc)))
+    text = console.export_text()
+    assert "first run broke" in text
+    assert "second run wobbled" in text
@@ -0,0 +1,249 @@
+"""Tests for job discovery caching over event logs."""
+from pathlib import Path
+
+from pdf_transcriber.events import EventEmitter
+from pdf_transcriber.tui import discovery
+from pdf_transcriber.tui.discovery import discover_jobs, event_log_fingerprint
+
+
+def _start_job(tmp_path: Path, job_id: str = "test-job") -> EventEmitter:
+    """Create an emitter under tmp_path and emit job_started."""
+    output_dir = tmp_path / job_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+    emitter = EventEmitter(job_id=job_id, output_dir=output_dir, central_dir=tmp_path / "telemetry")
+    emitter.emit_job_started(
+        pdf_path="/tmp/test.pdf",
+        output_dir=str(output_dir),
+        total_pages=10,
+        quality="fast",
+        mode="streaming",
+        metadata={},
+    )
+    return emitter
+
+
+def test_unchanged_log_is_not_reparsed(tmp_path, monkeypatch):
+    """A second discovery of an unchanged log reuses the cached parse."""
+    emitter = _start_job(tmp_path)
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    assert discover_jobs(tmp_path)[0].pages_completed == 1
+
+    def _fail(path, offset=0):
+        raise AssertionError("log reparsed")
+
+    monkeypatch.setattr(discovery, "read_event_log_from", _fail)
+    assert discover_jobs(tmp_path)[0].pages_completed == 1
+
+
+def test_appended_events_are_picked_up(tmp_path):
+    """Events appended after a discovery show up on the next one."""
+    emitter = _start_job(tmp_path)
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    discover_jobs(tmp_path)
+
+    emitter.emit_page_completed(page_number=2, duration_ms=500)
+    emitter.emit_job_completed(total_pages=10, pages_completed=2, pages_failed=0)
+
+    job = discover_jobs(tmp_path)[0]
+    assert job.pages_completed == 2
+    assert job.current_page == 2
+    assert job.completed_at is not None
+    assert job.is_active is False
+
+
+def test_only_appended_bytes_are_parsed(tmp_path, monkeypatch):
+    """A growing log is parsed from the previous offset, not from the start."""
+    emitter = _start_job(tmp_path)
+    discover_jobs(tmp_path)
+
+    offsets = []
+    real_read = discovery.read_event_log_from
+
+    def _spy(path, offset=0):
+        offsets.append(offset)
+        return real_read(path, offset)
+
+    monkeypatch.setattr(discovery, "read_event_log_from", _spy)
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+
+    assert discover_jobs(tmp_path)[0].pages_completed == 1
+    assert offsets and offsets[0] > 0
+
+
+def test_truncated_log_is_reparsed(tmp_path):
+    """A log rewritten shorter than the cached offset is parsed from scratch."""
+    emitter = _start_job(tmp_path)
+    for page in range(1, 4):
+        emitter.emit_page_completed(page_number=page, duration_ms=500)
+    assert discover_jobs(tmp_path)[0].pages_completed == 3
+
+    emitter.central_log_path.unlink()
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+
+    job = discover_jobs(tmp_path)[0]
+    assert job.pages_completed == 1
+    assert job.total_pages is None
+
+
+def test_fingerprint_changes_only_on_write(tmp_path):
+    """The fingerprint is stable across idle scans and moves on append."""
+    emitter = _start_job(tmp_path)
+    before = event_log_fingerprint(tmp_path)
+    assert [name for name, _, _ in before] == ["test-job"]
+    assert event_log_fingerprint(tmp_path) == before
+
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    assert event_log_fingerprint(tmp_path) != before
+
+
+def test_ordering_and_recent_limit(tmp_path):
+    """Active jobs come first by progress; only the newest finished are kept."""
+    for job_id, pages in [("slow", 1), ("fast", 3)]:
+        emitter = _start_job(tmp_path, job_id)
+        for page in range(1, pages + 1):
+            emitter.emit_page_completed(page_number=page, duration_ms=500)
+
+    for job_id in ["old", "mid", "new"]:
+        emitter = _start_job(tmp_path, job_id)
+        emitter.emit_job_completed(total_pages=10, pages_completed=10, pages_failed=0)
+
+    assert [j.job_id for j in discover_jobs(tmp_path, recent_limit=2)] == [
+        "fast", "slow", "new", "mid"
+    ]
+    assert len(discover_jobs(tmp_path)) == 5
+
+
+def test_finished_job_reads_only_log_ends(tmp_path, monkeypatch):
+    """A completed log is summarized from job_started + job_completed alone."""
+    emitter = _start_job(tmp_path)
+    for page in range(1, 6):
+        emitter.emit_page_completed(page_number=page, duration_ms=500)
+    emitter.emit_error(severity="warning", error_type="low_confidence", error_message="meh")
+    emitter.emit_job_completed(total_pages=10, pages_completed=5, pages_failed=0)
+
+    def _fail(path, offset=0):
+        raise AssertionError("full parse of a finished log")
+
+    monkeypatch.setattr(discovery, "read_event_log_from", _fail)
+    job = discover_jobs(tmp_path)[0]
+    assert job.is_active is False
+    assert job.total_pages == 10
+    assert job.pages_completed == 5
+    assert job.warning_count == 1
+
+
+def test_finished_rerun_uses_newest_job_started(tmp_path, monkeypatch):
+    """A log holding two runs is summarized from the last one."""
+    emitter = _start_job(tmp_path)
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    emitter.emit_job_completed(total_pages=10, pages_completed=1, pages_failed=0)
+    emitter.emit_job_started(
+        pdf_path="/tmp/test.pdf",
+        output_dir=str(tmp_path / "test-job"),
+        total_pages=20,
+        quality="high-quality",
+        mode="streaming",
+        metadata={},
+    )
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    emitter.emit_job_completed(total_pages=20, pages_completed=1, pages_failed=0)
+
+    def _fail(path, offset=0):
+        raise AssertionError("full parse of a finished log")
+
+    monkeypatch.setattr(discovery, "read_event_log_from", _fail)
+    job = discover_jobs(tmp_path)[0]
+    assert job.total_pages == 20
+    assert job.quality == "high-quality"
+
+
+def test_parse_timestamp_forms():
+    """Both 'Z' and '+00:00' forms parse to the same aware datetime."""
+    from datetime import datetime
+
+    for ts in [
+        "2026-02-14T19:01:00.000000Z",
+        "2026-02-14T19:01:00.123456Z",
+        "2026-02-14T19:01:00Z",
+        "2026-02-14T19:01:00.5+00:00",
+        "2026-12-31T23:59:59.999999Z",
+    ]:
+        expected = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        assert discovery._parse_timestamp(ts) == expected
+        assert discovery._parse_timestamp(ts).utcoffset() == expected.utcoffset()
+
+    assert discovery._parse_timestamp("not-a-timestamp-at-all-xx") is None
+    assert discovery._parse_timestamp(None) is None
+
+
+def test_old_history_beyond_recent_limit_is_skipped(tmp_path, monkeypatch):
+    """Logs older than the newest recent_limit finished jobs are not parsed."""
+    import os
+    import time
+
+    emitters = {}
+    for job_id in ["ancient", "old", "new"]:
+        emitters[job_id] = _start_job(tmp_path, job_id)
+        emitters[job_id].emit_job_completed(total_pages=10, pages_completed=10, pages_failed=0)
+
+    # Age the two older logs well past the stale threshold
+    hour_ago = time.time() - 3600
+    os.utime(emitters["ancient"].central_log_path, (hour_ago - 60, hour_ago - 60))
+    os.utime(emitters["old"].central_log_path, (hour_ago, hour_ago))
+
+    parsed = []
+    real_parse = discovery._parse_job_from_events
+
+    def _spy(job_dir, *args):
+        parsed.append(job_dir.name)
+        return real_parse(job_dir, *args)
+
+    monkeypatch.setattr(discovery, "_parse_job_from_events", _spy)
+    assert [j.job_id for j in discover_jobs(tmp_path, recent_limit=1)] == ["new"]
+    assert parsed == ["new"]
+
+    parsed.clear()
+    assert len(discover_jobs(tmp_path)) == 3
+    assert sorted(parsed) == ["ancient", "new", "old"]
+
+
+def test_recreated_symlink_is_followed(tmp_path):
+    """A repointed events.jsonl symlink is re-resolved, not served from cache."""
+    import os
+
+    emitter = _start_job(tmp_path)
+    link = tmp_path / "test-job" / "events.jsonl"
+    first_target = discovery._resolve_event_log(link)
+    assert first_target == emitter.central_log_path.resolve()
+    assert discovery._resolve_event_log(link) == first_target
+
+    other = tmp_path / "other.jsonl"
+    other.write_text("")
+    link.unlink()
+    os.symlink(other, link)
+    assert discovery._resolve_event_log(link) == other.resolve()
+
+
+def test_event_missing_required_field_is_skipped(tmp_path):
+    """A raw event missing a required key leaves the job untouched."""
+    emitter = _start_job(tmp_path)
+    emitter.emit_page_completed(page_number=1, duration_ms=500)
+    with open(emitter.central_log_path, "a") as f:
+        f.write('{"event_type": "heartbeat", "timestamp": "2026-02-14T19:05:00Z"}\n')
+
+    job = discover_jobs(tmp_path)[0]
+    assert job.current_page == 1
+    assert job.last_heartbeat is None
+
+
+def test_caches_forget_removed_jobs(tmp_path):
+    """Discovery drops cached parses of logs that no longer exist."""
+    _start_job(tmp_path, "kept")
+    _start_job(tmp_path, "removed")
+    discover_jobs(tmp_path)
+    assert len(discovery._JOB_CACHE) == 2
+
+    (tmp_path / "removed" / "events.jsonl").unlink()
+    assert [job.job_id for job in discover_jobs(tmp_path)] == ["kept"]
+    assert [entry[3].job_id for entry in discovery._JOB_CACHE.values()] == ["kept"]
+    assert len(discovery._SYMLINK_CACHE) == 1
@@ -15,7 +15,9 @@ from pdf_transcriber.event_types import (
 from pdf_transcriber.events import (
     EventEmitter,
     ProgressTracker,
+    iter_event_log_reversed,
     parse_event,
+    read_event_log,
     read_event_log_typed,
 )
 from pdf_transcriber.tui.discovery import discover_jobs
@@ -302,9 +304,58 @@ def test_from_dict_round_trip():
         ),
     ]
 
-    for event in events:
-        d = event.to_dict()
-        # Simulate JSON round-trip (catches non-serializable types)
-        d = json.loads(json.dumps(d))
+    # Simulate JSON round-trip of the whole batch (catches non-serializable types)
+    dicts = json.loads(json.dumps([event.to_dict() for event in events]))
+    for event, d in zip(events, dicts, strict=True):
         restored = type(event).from_dict(d)
         assert restored == event, f"Round-trip failed for {type(event).__name__}: {restored} != {event}"
+
+
+# ---------------------------------------------------------------------------
+# Shared heartbeat thread
+# ---------------------------------------------------------------------------
+
+
+def test_heartbeats_share_one_thread(tmp_path):
+    """Concurrent jobs are served by one dispatcher thread; stop ends emission."""
+    import threading
+    import time
+
+    emitters = [_make_emitter(tmp_path, f"hb-{i}") for i in range(2)]
+    for emitter in emitters:
+        emitter._heartbeat_interval = 0.05
+        emitter.start_heartbeat(total_pages=10)
+
+    time.sleep(0.3)
+    names = [t.name for t in threading.enumerate()]
+    assert names.count("pdf-transcriber-heartbeat") == 1
+
+    for emitter in emitters:
+        emitter.stop_heartbeat()
+
+    for emitter in emitters:
+        events = read_event_log_typed(emitter.central_log_path)
+        heartbeats = [e for e in events if isinstance(e, HeartbeatEvent)]
+        assert heartbeats
+        assert heartbeats[-1].total_pages == 10
+
+    counts = [len(read_event_log_typed(e.central_log_path)) for e in emitters]
+    time.sleep(0.15)
+    assert [len(read_event_log_typed(e.central_log_path)) for e in emitters] == counts
+
+
+# ---------------------------------------------------------------------------
+# Backward reading
+# ---------------------------------------------------------------------------
+
+
+def test_reversed_read_matches_forward_read(tmp_path):
+    """Reading backwards in small chunks yields the forward events reversed."""
+    log_path = tmp_path / "events.jsonl"
+    lines = [json.dumps({"event_type": "heartbeat", "seq": i, "pad": "x" * (i % 7)}) for i in range(40)]
+    # Blank and malformed lines are skipped; the last line has no newline
+    log_path.write_text("\n".join(lines[:20] + ["", "{not json"] + lines[20:]))
+
+    backwards = list(iter_event_log_reversed(log_path, chunk_size=16))
+    assert backwards == read_event_log(log_path)[::-1]
+    assert [e["seq"] for e in backwards] == list(range(39, -1, -1))
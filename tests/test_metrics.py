@@ -0,0 +1,239 @@
+"""Tests for velocity/ETA metrics over event logs."""
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from pdf_transcriber.tui import metrics
+from pdf_transcriber.tui.metrics import RollingVelocity, calculate_metrics
+
+
+def _append(log_path: Path, *events: dict) -> None:
+    """Append raw events to a JSONL log."""
+    with open(log_path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _job_started(total_pages: int = 100) -> dict:
+    return {
+        "timestamp": "2026-02-14T19:00:00.000000Z",
+        "event_type": "job_started",
+        "job_id": "paper",
+        "pdf_path": "/tmp/paper.pdf",
+        "output_dir": "/tmp/out/paper",
+        "total_pages": total_pages,
+        "quality": "balanced",
+        "mode": "streaming",
+        "metadata": {},
+    }
+
+
+def _page_completed(page: int) -> dict:
+    # One page per minute
+    return {
+        "timestamp": f"2026-02-14T{19 + page // 60:02d}:{page % 60:02d}:00.000000Z",
+        "event_type": "page_completed",
+        "job_id": "paper",
+        "page_number": page,
+        "duration_ms": 60000,
+    }
+
+
+def _heartbeat(page: int) -> dict:
+    return {
+        "timestamp": f"2026-02-14T{19 + page // 60:02d}:{page % 60:02d}:30.000000Z",
+        "event_type": "heartbeat",
+        "job_id": "paper",
+        "current_page": page,
+        "total_pages": 100,
+        "pages_completed_since_last_heartbeat": 1,
+        "cpu_percent": 50.0,
+        "memory_mb": 2048,
+    }
+
+
+def _job_completed(
+    pages_completed: int,
+    pages_failed: int = 0,
+    duration_seconds: float = 1800.0,
+    velocity: float = 60.0,
+) -> dict:
+    return {
+        "timestamp": "2026-02-14T20:41:00.000000Z",
+        "event_type": "job_completed",
+        "job_id": "paper",
+        "total_pages": 100,
+        "pages_completed": pages_completed,
+        "pages_failed": pages_failed,
+        "total_duration_seconds": duration_seconds,
+        "avg_velocity_pages_per_hour": velocity,
+        "error_count": pages_failed,
+        "warning_count": 0,
+    }
+
+
+def test_velocity_and_progress(tmp_path):
+    """Ten pages a minute apart give 60 pg/hr over a 10-page window."""
+    log_path = tmp_path / "events.jsonl"
+    _append(log_path, _job_started(), *[_page_completed(p) for p in range(1, 11)], _heartbeat(10))
+
+    m = calculate_metrics(log_path)
+    assert m is not None
+    assert m.pages_completed == 10
+    assert m.current_page == 10
+    assert m.progress_percent == 10.0
+    # 10 pages over 9 minutes
+    assert m.velocity_pages_per_hour == round(10 / (9 / 60), 1)
+    assert m.window_size == 10
+    assert m.eta_hours is not None
+
+
+def test_only_appended_lines_are_parsed(tmp_path, monkeypatch):
+    """An unchanged log isn't read; a grown one is read from the old end."""
+    log_path = tmp_path / "events.jsonl"
+    _append(log_path, _job_started(), *[_page_completed(p) for p in range(1, 6)])
+    assert calculate_metrics(log_path).pages_completed == 5
+    end = log_path.stat().st_size
+
+    offsets = []
+    real_read = metrics.read_event_log_typed_from
+
+    def _spy(path, offset=0):
+        offsets.append(offset)
+        return real_read(path, offset)
+
+    monkeypatch.setattr(metrics, "read_event_log_typed_from", _spy)
+    assert calculate_metrics(log_path).pages_completed == 5
+    assert offsets == []
+
+    _append(log_path, _page_completed(6))
+    assert calculate_metrics(log_path).pages_completed == 6
+    assert offsets == [end]
+
+
+def test_truncated_log_is_refolded(tmp_path):
+    """A log rewritten shorter is folded again from the start."""
+    log_path = tmp_path / "events.jsonl"
+    _append(log_path, _job_started(), *[_page_completed(p) for p in range(1, 11)])
+    assert calculate_metrics(log_path).pages_completed == 10
+
+    log_path.unlink()
+    _append(log_path, _job_started(total_pages=50), _page_completed(1))
+    m = calculate_metrics(log_path)
+    assert m.pages_completed == 1
+    assert m.total_pages == 50
+
+
+def test_rolling_velocity_keeps_only_window():
+    """Old pages fall out of the window; the total count keeps growing."""
+    rv = RollingVelocity(window_size=4, min_pages=3)
+    start = datetime(2026, 2, 14, 19, 0, tzinfo=timezone.utc)
+    # Slow first pages, then one page a minute
+    for minutes in (0, 30, 60, 61, 62, 63):
+        rv.update(start + timedelta(minutes=minutes))
+        if rv.count < 3:
+            assert rv.value() == (0.0, 0)
+
+    assert rv.count == 6
+    assert rv.value() == (4 / (3 / 60), 4)
+
+
+def test_parse_timestamp_forms():
+    """Trailing 'Z' parses to UTC; empty and malformed strings give None."""
+    ts = "2026-02-14T19:00:00.000000Z"
+    assert metrics._parse_timestamp(ts) == datetime(2026, 2, 14, 19, 0, tzinfo=timezone.utc)
+    assert metrics._parse_timestamp(None) is None
+    assert metrics._parse_timestamp("not a timestamp") is None
+
+
+def test_rolling_velocity_out_of_order_page():
+    """A late-logged page lands in time order; the oldest is evicted."""
+    start = datetime(2026, 2, 14, 19, 0, tzinfo=timezone.utc)
+    rv = RollingVelocity(window_size=3, min_pages=3)
+    for minutes in (0, 10, 20, 15, 1):
+        rv.update(start + timedelta(minutes=minutes))
+
+    # Window holds the newest three by time: 10, 15, 20
+    assert rv.count == 5
+    assert rv.value() == (3 / (10 / 60), 3)
+
+
+def test_completed_job_uses_final_event(tmp_path, monkeypatch):
+    """A log ending in job_completed is summarized without a forward parse."""
+    log_path = tmp_path / "events.jsonl"
+    _append(
+        log_path,
+        _job_started(),
+        *[_page_completed(p) for p in range(1, 101)],
+        _job_completed(98, pages_failed=2, duration_seconds=6000.0, velocity=58.8),
+    )
+
+    def _fail(path, offset=0):
+        raise AssertionError("log parsed forward")
+
+    monkeypatch.setattr(metrics, "read_event_log_typed_from", _fail)
+    m = calculate_metrics(log_path)
+    assert m.pages_completed == 98
+    assert m.progress_percent == 98.0
+    assert m.velocity_pages_per_hour == 58.8
+    assert m.elapsed_time == timedelta(seconds=6000)
+    assert m.eta_hours is None
+    assert calculate_metrics(log_path) is m
+
+
+def test_formatters():
+    """Formatters render whole minutes and local clock time."""
+    assert metrics.format_elapsed_time(None) == "Unknown"
+    assert metrics.format_elapsed_time(timedelta(minutes=59, seconds=59)) == "59m"
+    assert metrics.format_elapsed_time(timedelta(hours=2, minutes=5)) == "2h 5m"
+    assert metrics.format_eta(0.5) == "~30m"
+    assert metrics.format_eta(2.25) == "~2.2h"
+
+    dt = datetime(2026, 2, 14, 19, 42, 31, tzinfo=timezone.utc)
+    assert metrics.format_completion_time(dt) == dt.astimezone().strftime("%H:%M")
+
+
+def test_now_is_used_for_elapsed_and_eta(tmp_path):
+    """A caller-supplied clock drives both elapsed time and completion time."""
+    log_path = tmp_path / "events.jsonl"
+    _append(log_path, _job_started(), *[_page_completed(p) for p in range(1, 11)], _heartbeat(10))
+
+    now = datetime(2026, 2, 14, 20, 0, tzinfo=timezone.utc)
+    m = calculate_metrics(log_path, now=now)
+    assert m.elapsed_time == timedelta(hours=1)
+    assert m.completion_time == now + timedelta(hours=m.eta_hours)
+
+
+def test_failed_job_reports_pages_done(tmp_path):
+    """A run that stopped partway shows its real progress, tailed or not."""
+    tailed = tmp_path / "tailed.jsonl"
+    fresh = tmp_path / "fresh.jsonl"
+    history = [_job_started(), *[_page_completed(p) for p in range(1, 31)], _heartbeat(30)]
+    _append(tailed, *history)
+    _append(fresh, *history, _job_completed(30, pages_failed=70))
+
+    # The tailed log completes after the tailer has already read it
+    assert calculate_metrics(tailed).current_page == 30
+    _append(tailed, _job_completed(30, pages_failed=70))
+
+    m = calculate_metrics(tailed)
+    assert (m.current_page, m.total_pages, m.progress_percent) == (30, 100, 30.0)
+    assert m.window_size == 0
+    assert m.eta_hours is None
+    assert calculate_metrics(fresh) == m
+
+
+def test_prune_forgets_logs_not_discovered(tmp_path):
+    """Cached state survives only for logs still listed by discovery."""
+    kept = tmp_path / "kept.jsonl"
+    gone = tmp_path / "gone.jsonl"
+    for log_path in (kept, gone):
+        _append(log_path, _job_started(), *[_page_completed(p) for p in range(1, 6)])
+        calculate_metrics(log_path)
+    _append(gone, _job_completed(5))
+    calculate_metrics(gone)
+
+    metrics.prune_metrics_cache([kept])
+    cached = {key[0] for key in metrics._TAILERS} | set(metrics._COMPLETED)
+    assert str(kept) in cached
+    assert str(gone) not in cached
@@ -0,0 +1,141 @@
+"""Tests for StateManager event replay, checkpoints and batched state writes."""
+import json
+from pathlib import Path
+
+from pdf_transcriber.core.state_manager import StateManager
+
+
+def _append(log_path: Path, *events: dict) -> None:
+    """Append raw events to a JSONL log."""
+    with open(log_path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _job_started(total_pages: int = 10) -> dict:
+    return {
+        "timestamp": "2026-02-14T19:01:00.000000Z",
+        "event_type": "job_started",
+        "job_id": "paper",
+        "pdf_path": "/tmp/paper.pdf",
+        "output_dir": "/tmp/out/paper",
+        "total_pages": total_pages,
+        "quality": "balanced",
+        "mode": "streaming",
+        "metadata": {},
+    }
+
+
+def _page_completed(page: int) -> dict:
+    return {
+        "timestamp": f"2026-02-14T19:02:{page:02d}.000000Z",
+        "event_type": "page_completed",
+        "job_id": "paper",
+        "page_number": page,
+        "duration_ms": 1000,
+    }
+
+
+def _make_log(tmp_path: Path) -> Path:
+    paper_dir = tmp_path / "paper"
+    paper_dir.mkdir()
+    return paper_dir / "events.jsonl"
+
+
+def test_replay_picks_up_appended_events(tmp_path):
+    """Repeated loads see events appended after the in-memory checkpoint."""
+    log_path = _make_log(tmp_path)
+    _append(log_path, _job_started(), _page_completed(1))
+
+    state_mgr = StateManager(tmp_path, "paper")
+    assert state_mgr.load_state_from_events().completed_pages == [1]
+
+    _append(log_path, _page_completed(2), {
+        "timestamp": "2026-02-14T19:03:00.000000Z",
+        "event_type": "error",
+        "job_id": "paper",
+        "severity": "error",
+        "error_type": "ocr_fail",
+        "error_message": "boom",
+        "page_number": 3,
+    })
+
+    state = state_mgr.load_state_from_events()
+    assert state.completed_pages == [1, 2]
+    assert state.failed_pages == [3]
+    assert state.last_updated == "2026-02-14T19:03:00.000000Z"
+
+
+def test_resume_from_snapshot(tmp_path):
+    """A new StateManager resumes from snapshot.json plus the log tail."""
+    log_path = _make_log(tmp_path)
+    _append(log_path, _job_started(), _page_completed(1), _page_completed(2))
+
+    first = StateManager(tmp_path, "paper")
+    first.load_state_from_events()
+    first.snapshot()
+    assert first.snapshot_file.exists()
+
+    _append(log_path, _page_completed(3))
+
+    resumed = StateManager(tmp_path, "paper")
+    assert resumed.load_state_from_events().completed_pages == [1, 2, 3]
+    assert resumed.get_pending_pages() == list(range(4, 11))
+
+
+def test_snapshot_ignored_when_log_truncated(tmp_path):
+    """A snapshot past the end of a rewritten log falls back to full replay."""
+    log_path = _make_log(tmp_path)
+    _append(log_path, _job_started(), _page_completed(1), _page_completed(2))
+
+    first = StateManager(tmp_path, "paper")
+    first.load_state_from_events()
+    first.snapshot()
+
+    log_path.unlink()
+    _append(log_path, _job_started(total_pages=5))
+
+    state = StateManager(tmp_path, "paper").load_state_from_events()
+    assert state.total_pages == 5
+    assert state.completed_pages == []
+
+
+def _saved_pages(state_mgr: StateManager) -> list[int]:
+    """completed_pages as currently written to state.json."""
+    return json.loads(state_mgr.state_file.read_text())["completed_pages"]
+
+
+def test_page_writes_are_batched(tmp_path):
+    """state.json is rewritten every flush_every pages; reads see the batch."""
+    state_mgr = StateManager(tmp_path, "paper", flush_every=3)
+    state_mgr.create_job("/tmp/paper.pdf", 10, "markdown", "balanced")
+
+    state_mgr.mark_page_complete(1, "one")
+    state_mgr.mark_page_complete(2, "two")
+    assert _saved_pages(state_mgr) == []
+    assert state_mgr.load_state_from_events().completed_pages == [1, 2]
+
+    state_mgr.mark_page_complete(3, "three")
+    assert _saved_pages(state_mgr) == [1, 2, 3]
+
+    state_mgr.mark_page_complete(4, "four")
+    assert _saved_pages(state_mgr) == [1, 2, 3]
+
+
+def test_flush_batch_writes_held_back_pages(tmp_path):
+    """flush_batch() (run when a job exits) writes the partial batch once."""
+    state_mgr = StateManager(tmp_path, "paper", flush_every=8)
+    state_mgr.create_job("/tmp/paper.pdf", 10, "markdown", "balanced")
+    state_mgr.mark_page_complete(1, "one")
+    state_mgr.mark_page_complete(2, "two")
+
+    state_mgr.flush_batch()
+    assert _saved_pages(state_mgr) == [1, 2]
+
+    # Nothing pending: a second flush leaves the file alone
+    mtime = state_mgr.state_file.stat().st_mtime_ns
+    state_mgr.flush_batch()
+    assert state_mgr.state_file.stat().st_mtime_ns == mtime
+
+    # A fresh manager resumes from what was flushed
+    assert StateManager(tmp_path, "paper").load_state_from_events().completed_pages == [1, 2]